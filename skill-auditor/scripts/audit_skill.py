@@ -11,8 +11,17 @@ import yaml
 import json
 import argparse
 import datetime
+import subprocess
+import functools
+from dataclasses import dataclass, asdict
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator; fall back to the standard json module
+    orjson = None
+
 # Initialize ANSI color support
 def init_color_support():
     """Initialize color output support based on terminal capabilities."""
@@ -45,38 +54,64 @@ PASS_TEXT = "[PASS]"
 FAIL_TEXT = "[FAIL]"
 WARN_TEXT = "[WARN]"
 
+# Report lines are buffered and written to stdout in one call per audit
+_report_buffer = []
+
+def _emit(msg):
+    _report_buffer.append(f"{msg}\n")
+
+def flush_report():
+    """Write all buffered report lines to stdout in a single call."""
+    if _report_buffer:
+        sys.stdout.write("".join(_report_buffer))
+        sys.stdout.flush()
+        _report_buffer.clear()
+
 def print_pass(msg, json_output=False):
     if json_output:
         return
     if COLOR_SUPPORT:
-        print(f"{GREEN}{PASS_TEXT}{RESET} {msg}")
+        _emit(f"{GREEN}{PASS_TEXT}{RESET} {msg}")
     else:
-        print(f"{PASS_TEXT} {msg}")
+        _emit(f"{PASS_TEXT} {msg}")
 
 def print_fail(msg, json_output=False):
     if json_output:
         return
     if COLOR_SUPPORT:
-        print(f"{RED}{FAIL_TEXT}{RESET} {msg}")
+        _emit(f"{RED}{FAIL_TEXT}{RESET} {msg}")
     else:
-        print(f"{FAIL_TEXT} {msg}")
+        _emit(f"{FAIL_TEXT} {msg}")
 
 def print_warn(msg, json_output=False):
     if json_output:
         return
     if COLOR_SUPPORT:
-        print(f"{YELLOW}{WARN_TEXT}{RESET} {msg}")
+        _emit(f"{YELLOW}{WARN_TEXT}{RESET} {msg}")
     else:
-        print(f"{WARN_TEXT} {msg}")
+        _emit(f"{WARN_TEXT} {msg}")
 
 def print_info(msg, json_output=False):
     if json_output:
         return
-    print(msg)
+    _emit(msg)
 
 def print_verbose(msg, verbose=False):
     if verbose:
-        print(f"  {msg}")
+        _emit(f"  {msg}")
+
+@functools.lru_cache(maxsize=1024)
+def _read_text_cached(path_str, mtime_ns):
+    """
+    Read a text file, memoized on (path, mtime) so that every check sees the
+    same decoded content and repeated audits of a tree skip the disk.
+    Undecodable bytes are replaced rather than raising UnicodeDecodeError.
+    """
+    return Path(path_str).read_text(encoding='utf-8', errors='replace')
+
+def _read_text(path):
+    """Read a file as UTF-8 through the mtime-keyed cache."""
+    return _read_text_cached(str(path), path.stat().st_mtime_ns)
 
 def check_dependencies(skill_path):
     """Check if requirements.txt exists and matches imports"""
@@ -104,20 +139,22 @@ def check_dependencies(skill_path):
 
     for py_file in py_files:
         try:
-            content = py_file.read_text(encoding='utf-8')
+            content = _read_text(py_file)
             # Regex for 'import X' or 'from X import Y'
             imports = re.findall(r'^\s*(?:import|from)\s+([a-zA-Z0-9_]+)', content, re.MULTILINE)
             for module in imports:
                 if module not in std_lib and module != 'scripts':
                     imported_modules.add(module)
-        except UnicodeDecodeError as e:
-            print(f"Warning: Could not decode {py_file.name}: {e}")
         except Exception as e:
-            print(f"Warning: Could not read {py_file.name}: {e}")
+            _emit(f"Warning: Could not read {py_file.name}: {e}")
 
     # Read requirements
     try:
-        req_content = req_file.read_text(encoding='utf-8').lower()
+        req_content = _read_text(req_file).lower()
+        # Optional packages (e.g. accelerators behind an ImportError fallback) count as declared
+        optional_file = scripts_dir / 'requirements-optional.txt'
+        if optional_file.exists():
+            req_content += '\n' + _read_text(optional_file).lower()
         declared_deps = set(line.split('==')[0].split('>=')[0].strip() for line in req_content.splitlines() if line.strip() and not line.startswith('#'))
     except Exception:
         return False, "Could not read requirements.txt"
@@ -131,12 +168,15 @@ def check_dependencies(skill_path):
         'git': 'gitpython'
     }
 
+    # Local modules importable from scripts/, taken from the glob above
+    local_modules = {p.stem for p in py_files if p.parent == scripts_dir}
+
     missing_deps = []
     for module in imported_modules:
         pkg_name = pkg_map.get(module, module).lower()
         if pkg_name not in declared_deps and module.lower() not in declared_deps:
             # Check if it's a local file import
-            if not (scripts_dir / f"{module}.py").exists():
+            if module not in local_modules:
                  missing_deps.append(f"{module} (package: {pkg_name})")
 
     if missing_deps:
@@ -144,44 +184,40 @@ def check_dependencies(skill_path):
 
     return True, "Dependency configuration looks good"
 
+# Call sites of builtin open(), read_text() and write_text(); group 2 is the rest of the line
+_FILE_OP_RE = re.compile(rb"((?<![\w.])open\b|\.read_text|\.write_text)\s*\(([^\n]*)")
+# Binary mode string such as 'rb', "wb" or 'ab+'
+_BINARY_MODE_RE = re.compile(rb"""['"][rwax+]*b[rwax+]*['"]""")
+
 def check_encoding_safety(skill_path):
     """Check for explicit encoding in file operations"""
     issues = []
     
-    # Patterns to check
-    # 1. open() without encoding
-    # 2. read_text() without encoding
-    # 3. write_text() without encoding
-    
-    # Heuristic check for file operations
+    # Scan raw bytes for file operation call sites, then inspect only the
+    # arguments of each match instead of testing every line of the file
     for py_file in skill_path.glob('**/*.py'):
         try:
-            content = py_file.read_text(encoding='utf-8')
-            lines = content.splitlines()
-            
-            for i, line in enumerate(lines, 1):
-                # Simple heuristic check
-                # Check keywords separately to avoid self-match in the heuristic logic line itself
-                # Also ignore comments
-                if line.strip().startswith('#'):
+            data = py_file.read_bytes()
+            line_no, line_pos = 1, 0
+            for match in _FILE_OP_RE.finditer(data):
+                func, args = match.groups()
+                # Skip open() mentioned in prose, explicit encodings and binary modes;
+                # an empty read_text()/write_text() call is exactly the unsafe case
+                if func == b'open' and args.startswith(b')'):
+                    continue
+                if b'encoding' in args or _BINARY_MODE_RE.search(args):
                     continue
-
-                has_file_op = False
-                if 'open(' in line: has_file_op = True
-                if '.read_text(' in line: has_file_op = True
-                if '.write_text(' in line: has_file_op = True
                 
-                if has_file_op:
-                    # Skip self-check for this line in auditor script
-                    if 'has_file_op =' in line or 'heuristic check' in line:
-                        continue
-                        
-                    if 'encoding' not in line and 'b' not in line: # Skip binary modes
-                        # Double check context - might be binary open or already safe
-                        # This is a strict check, manual review might be needed
-                        issues.append(f"{py_file.name}:{i}: Potential unsafe file op without explicit encoding: {line.strip()}")
+                line_start = data.rfind(b'\n', 0, match.start()) + 1
+                line = data[line_start:match.end()].strip()
+                if line.startswith(b'#'):
+                    continue
+                
+                line_no += data.count(b'\n', line_pos, match.start())
+                line_pos = match.start()
+                issues.append(Issue(path=py_file.name, line=line_no, text=f"Potential unsafe file op without explicit encoding: {line.decode('utf-8', errors='replace')}"))
         except Exception as e:
-            issues.append(f"Could not read {py_file.name}: {e}")
+            issues.append(Issue(text=f"Could not read {py_file.name}: {e}"))
             
     if issues:
         return False, issues
@@ -204,13 +240,13 @@ def check_path_consistency(skill_path):
             continue
             
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = _read_text(file_path)
             if '.codebuddy' in content:
                 try:
                     rel_path = file_path.relative_to(skill_path)
                 except ValueError:
                     rel_path = file_path.name
-                issues.append(f"{rel_path}: Contains reference to '.codebuddy'")
+                issues.append(Issue(path=str(rel_path), text="Contains reference to '.codebuddy'"))
         except Exception:
             pass
             
@@ -218,6 +254,26 @@ def check_path_consistency(skill_path):
         return False, issues
     return True, "No outdated path references found"
 
+def extract_frontmatter(content):
+    """
+    Extract the raw YAML frontmatter block from SKILL.md content.
+
+    Only the leading '---' block is sliced out with str.find, so the cost does
+    not grow with the length of the markdown body.
+
+    Args:
+        content: Full text of SKILL.md.
+
+    Returns:
+        str: Frontmatter text between the '---' markers, or None if not found
+    """
+    if not content.startswith('---\n'):
+        return None
+    end = content.find('\n---', 4)
+    if end == -1:
+        return None
+    return content[4:end]
+
 def check_skill_name_consistency(skill_path):
     """
     Check if skill directory name matches SKILL.md frontmatter name.
@@ -233,12 +289,12 @@ def check_skill_name_consistency(skill_path):
         return True, "SKILL.md not found (skipping name check)"
     
     try:
-        content = skill_md.read_text(encoding='utf-8')
-        match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-        if not match:
+        content = _read_text(skill_md)
+        frontmatter_text = extract_frontmatter(content)
+        if frontmatter_text is None:
             return True, "SKILL.md frontmatter not found (skipping name check)"
-        
-        frontmatter = yaml.safe_load(match.group(1))
+
+        frontmatter = yaml.safe_load(frontmatter_text)
         
         if 'name' not in frontmatter:
             return False, "SKILL.md frontmatter missing 'name' field"
@@ -253,6 +309,21 @@ def check_skill_name_consistency(skill_path):
     except Exception as e:
         return False, f"Error checking skill name consistency: {e}"
 
+# Optional standard directories of a skill
+_EXPECTED_DIRS = ("scripts", "references", "assets")
+# Top-level files allowed besides SKILL.md (common skill metadata files)
+_ALLOWED_TOP_LEVEL_FILES = frozenset({
+    "SKILL.md",
+    "README.md",
+    "LICENSE.txt",
+    "LICENSE",
+    ".gitignore",
+    "CLAUDE.md",
+    "requirements.txt"
+})
+# Reference documentation files allowed at the top level
+_REF_DOC_RE = re.compile(r'.*-(?:tracing|guide|protocol|reference|workflow|methodology)\.md$')
+
 def check_directory_structure(skill_path):
     """
     Check if skill directory structure follows standard conventions.
@@ -268,54 +339,32 @@ def check_directory_structure(skill_path):
     Returns:
         tuple: (success: bool, message: str | list[str])
     """
-    skill_md = skill_path / 'SKILL.md'
-    if not skill_md.exists():
-        return False, "SKILL.md not found at root directory"
-    
-    # Check for expected directories
-    expected_dirs = ["scripts", "references", "assets"]
     found_dirs = []
-    for d in expected_dirs:
-        if (skill_path / d).exists():
-            found_dirs.append(d)
-    
-    # Check for unexpected top-level files
-    # Extended allowed files list to include common skill metadata files
-    # and reference documentation files
-    allowed_files = [
-        "SKILL.md",
-        "README.md",
-        "LICENSE.txt",
-        "LICENSE",
-        ".gitignore",
-        "CLAUDE.md",
-        "requirements.txt"
-    ]
-    # Patterns for reference documentation files
-    ref_doc_patterns = [
-        r'.*-tracing\.md$',
-        r'.*-guide\.md$',
-        r'.*-protocol\.md$',
-        r'.*-reference\.md$',
-        r'.*-workflow\.md$',
-        r'.*-methodology\.md$'
-    ]
     unexpected_files = []
+    has_skill_md = False
     
+    # Single directory pass: collect expected directories and unexpected files
     try:
-        for item in skill_path.iterdir():
-            if item.is_file():
-                if item.name not in allowed_files:
-                    # Check if it matches reference documentation patterns
-                    is_ref_doc = any(re.match(pattern, item.name) for pattern in ref_doc_patterns)
-                    if not is_ref_doc:
-                        unexpected_files.append(item.name)
-    except Exception as e:
+        with os.scandir(skill_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name in _EXPECTED_DIRS:
+                        found_dirs.append(entry.name)
+                elif entry.is_file():
+                    if entry.name == 'SKILL.md':
+                        has_skill_md = True
+                    elif entry.name not in _ALLOWED_TOP_LEVEL_FILES and not _REF_DOC_RE.match(entry.name):
+                        unexpected_files.append(entry.name)
+    except OSError as e:
         return False, f"Could not scan directory: {e}"
     
+    if not has_skill_md:
+        return False, "SKILL.md not found at root directory"
+    found_dirs.sort(key=_EXPECTED_DIRS.index)
+    
     issues = []
     if unexpected_files:
-        issues.append(f"Unexpected top-level files: {', '.join(unexpected_files)}")
+        issues.append(Issue(text=f"Unexpected top-level files: {', '.join(unexpected_files)}"))
     
     if issues:
         return False, issues
@@ -328,7 +377,7 @@ def check_packaging_logic(skill_path):
         return True, "No package_skill.py found (skipped)"
         
     try:
-        content = package_script.read_text(encoding='utf-8')
+        content = _read_text(package_script)
         
         # Check 1: Relative path logic
         # Bad: relative_to(skill_path.parent)
@@ -360,16 +409,16 @@ def validate_frontmatter(skill_path):
         return True, "SKILL.md missing (Warning: Metadata might be missing)"
         
     try:
-        content = skill_md.read_text(encoding='utf-8')
+        content = _read_text(skill_md)
         if not content.startswith('---'):
             return False, "No YAML frontmatter"
             
         # Simple extraction
-        match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-        if not match:
+        frontmatter_text = extract_frontmatter(content)
+        if frontmatter_text is None:
             return False, "Invalid frontmatter format"
-            
-        frontmatter = yaml.safe_load(match.group(1))
+
+        frontmatter = yaml.safe_load(frontmatter_text)
         
         if 'name' not in frontmatter:
             return False, "Missing 'name'"
@@ -387,7 +436,7 @@ def check_init_script_template(skill_path):
         return True, "No init_skill.py found (skipped)"
         
     try:
-        content = init_script.read_text(encoding='utf-8')
+        content = _read_text(init_script)
         
         # Check for bad list syntax in description
         # Bad: description: [TODO: ...]
@@ -406,7 +455,50 @@ def check_init_script_template(skill_path):
     except Exception as e:
         return False, f"Error checking init script: {e}"
 
-def audit_skill(skill_path, skills_dir=None, verbose=False, json_output=False, check_level="standard"):
+def get_changed_files(skill_path):
+    """
+    List files under the skill that differ from git HEAD (including untracked files).
+    
+    Args:
+        skill_path: Path to the skill directory.
+        
+    Returns:
+        list[str]: Changed file paths, or None if git status is unavailable
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=all', '--', '.'],
+            cwd=skill_path, capture_output=True, text=True, errors='replace'
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    # Porcelain lines are "XY path" or "XY old -> new" for renames
+    return [line[3:].split(' -> ')[-1] for line in result.stdout.splitlines() if line]
+
+@dataclass
+class Issue:
+    """
+    A single audit finding, shared by the console and JSON reports.
+
+    Checks fill in path, line and text; severity and section are set by
+    audit_skill according to its check table.
+    """
+    severity: str = ""
+    section: str = ""
+    path: str = ""
+    line: int = 0
+    text: str = ""
+
+    def __str__(self):
+        if self.line:
+            return f"{self.path}:{self.line}: {self.text}"
+        if self.path:
+            return f"{self.path}: {self.text}"
+        return self.text
+
+def audit_skill(skill_path, skills_dir=None, verbose=False, json_output=False, check_level="standard", changed_only=False):
     """
     Audit a skill for compliance and best practices.
     
@@ -416,6 +508,7 @@ def audit_skill(skill_path, skills_dir=None, verbose=False, json_output=False, c
         verbose: Enable verbose output
         json_output: Output in JSON format
         check_level: Check strictness - "strict", "standard", or "relaxed"
+        changed_only: Skip file-content checks whose inputs are unchanged since git HEAD
     
     Returns:
         bool: True if audit passed, False otherwise
@@ -424,184 +517,122 @@ def audit_skill(skill_path, skills_dir=None, verbose=False, json_output=False, c
     if skills_dir is None:
         skills_dir = skill_path.parent
     
-    print(f"[*] Auditing Skill: {skill_path.name}")
-    print(f"   Path: {skill_path}\n")
-    
-    has_errors = False
-    has_warnings = False
-    
-    # Determine which checks to run based on check_level
-    # strict: all checks, i18n issues are errors
-    # standard: all checks, i18n issues are warnings (default)
-    # relaxed: only critical checks (basic structure, dependencies, encoding)
-    run_i18n_checks = check_level in ["strict", "standard"]
-    run_packaging_checks = check_level in ["strict", "standard"]
-    run_subprocess_checks = check_level in ["strict", "standard"]
-    run_cross_platform_checks = check_level in ["strict", "standard"]
-    run_absolute_ref_checks = check_level in ["strict", "standard"]
-    run_registry_checks = check_level in ["strict", "standard"]
-    i18n_as_error = (check_level == "strict")
-    
-    # Section 1: Basic Structure
-    print_info("=== Basic Structure ===", json_output)
-    
-    ok, msg = validate_frontmatter(skill_path)
-    if ok: print_pass(msg, json_output)
-    else: print_fail(msg, json_output); has_errors = True
-    
-    ok, msg = check_skill_name_consistency(skill_path)
-    if ok: print_pass(msg, json_output)
-    else: print_fail(msg, json_output); has_errors = True
-    
-    ok, msg = check_directory_structure(skill_path)
-    if ok: print_pass(msg, json_output)
-    else: 
-        print_fail("Directory structure issues:", json_output)
-        if isinstance(msg, list):
-            for issue in msg: print(f"      - {issue}")
-        else:
-            print(f"      - {msg}")
-        has_errors = True
-    
-    # Section 2: Dependencies
-    print_info("\n=== Dependencies ===", json_output)
-    
-    ok, msg = check_dependencies(skill_path)
-    if ok: print_pass(msg, json_output)
-    else: print_fail(msg, json_output); has_errors = True
-    
-    # Section 3: Encoding & Path Safety
-    print_info("\n=== Encoding & Path Safety ===", json_output)
-    
-    ok, msg = check_encoding_safety(skill_path)
-    if ok:
-        print_pass(msg, json_output)
-    else:
-        print_fail("Found potential encoding issues:", json_output)
-        for issue in msg:
-            print(f"      - {issue}")
-        has_errors = True
-        
-    ok, msg = check_path_consistency(skill_path)
-    if ok:
-        print_pass(msg, json_output)
-    else:
-        print_fail("Found path inconsistencies:", json_output)
-        for issue in msg:
-            print(f"      - {issue}")
-        has_errors = True
-    
-    # Section 4: Packaging
-    if run_packaging_checks:
-        print_info("\n=== Packaging ===", json_output)
-        
-        ok, msg = check_packaging_logic(skill_path)
-        if ok: print_pass(msg, json_output)
-        else: print_fail(msg, json_output); has_errors = True
-        
-        ok, msg = check_init_script_template(skill_path)
-        if ok: print_pass(msg, json_output)
-        else: print_fail(msg, json_output); has_errors = True
-    
-    # Section 5: Subprocess & Path Operations
-    if run_subprocess_checks:
-        print_info("\n=== Subprocess & Path Operations ===", json_output)
-        
-        ok, msg = check_subprocess_robustness(skill_path)
-        if ok:
-            print_pass(msg, json_output)
-        else:
-            print_fail("Found potential subprocess robustness issues:", json_output)
-            for issue in msg:
-                print(f"      - {issue}")
-            has_errors = True
-        
-        ok, msg = check_risky_path_ops(skill_path)
-        if ok:
-            print_pass(msg, json_output)
-        else:
-            print_fail("Found potential risky path operations:", json_output)
-            for issue in msg:
-                print(f"      - {issue}")
-            has_errors = True
-    
-    # Cross-Platform Compatibility
-    if run_cross_platform_checks:
-        ok, msg = check_cross_platform_compatibility(skill_path)
-        if ok:
-            print_pass(msg, json_output)
-        else:
-            print_fail("Found cross-platform compatibility issues:", json_output)
-            for issue in msg:
-                print(f"      - {issue}")
-            has_errors = True
-    
-    # Section 7: Internationalization (i18n)
-    if run_i18n_checks:
-        print_info("\n=== Internationalization (i18n) ===", json_output)
-        
-        ok, msg = check_i18n_support(skill_path)
-        if ok:
-            print_pass(msg, json_output)
-        else:
-            if i18n_as_error:
-                print_fail("Found i18n issues:", json_output)
-                has_errors = True
+    try:
+        print_info(f"[*] Auditing Skill: {skill_path.name}", json_output)
+        print_info(f"   Path: {skill_path}\n", json_output)
+    
+        # Determine which checks to run based on check_level
+        # strict: all checks, i18n issues are errors
+        # standard: all checks, i18n issues are warnings (default)
+        # relaxed: only critical checks (basic structure, dependencies, encoding)
+        run_extended_checks = check_level in ["strict", "standard"]
+        i18n_severity = "error" if check_level == "strict" else "warning"
+        i18n_header = "Found i18n issues:" if check_level == "strict" else "Found i18n issues (warnings):"
+    
+        # Each section: (title, enabled, [(check, failure header, severity)])
+        # A header of None prints the failure message inline instead of as a list
+        sections = [
+            ("Basic Structure", True, [
+                (validate_frontmatter, None, "error"),
+                (check_skill_name_consistency, None, "error"),
+                (check_directory_structure, "Directory structure issues:", "error"),
+            ]),
+            ("Dependencies", True, [
+                (check_dependencies, None, "error"),
+            ]),
+            ("Encoding & Path Safety", True, [
+                (check_encoding_safety, "Found potential encoding issues:", "error"),
+                (check_path_consistency, "Found path inconsistencies:", "error"),
+            ]),
+            ("Packaging", run_extended_checks, [
+                (check_packaging_logic, None, "error"),
+                (check_init_script_template, None, "error"),
+            ]),
+            ("Subprocess & Path Operations", run_extended_checks, [
+                (check_subprocess_robustness, "Found potential subprocess robustness issues:", "error"),
+                (check_risky_path_ops, "Found potential risky path operations:", "error"),
+                (check_cross_platform_compatibility, "Found cross-platform compatibility issues:", "error"),
+            ]),
+            ("Internationalization (i18n)", run_extended_checks, [
+                (check_i18n_support, i18n_header, i18n_severity),
+            ]),
+            ("Absolute References", run_extended_checks, [
+                (check_absolute_references, "Found absolute references:", "error"),
+            ]),
+            ("Registry & Map Consistency", run_extended_checks, [
+                (functools.partial(check_registry_consistency, skills_dir=skills_dir), "Registry consistency issues:", "warning"),
+                (functools.partial(check_skill_map_consistency, skills_dir=skills_dir), "Skill map consistency issues:", "warning"),
+            ]),
+        ]
+    
+        # In changed-only mode, skip checks whose inputs did not change since HEAD
+        skipped_checks = set()
+        if changed_only:
+            changed = get_changed_files(skill_path)
+            if changed is None:
+                print_verbose("git status unavailable, running all checks", verbose)
             else:
-                print_warn("Found i18n issues (warnings):", json_output)
-                has_warnings = True
-            for issue in msg:
-                print(f"      - {issue}")
-    
-    # Section 8: Absolute References
-    if run_absolute_ref_checks:
-        print_info("\n=== Absolute References ===", json_output)
-        
-        ok, msg = check_absolute_references(skill_path)
-        if ok:
-            print_pass(msg, json_output)
-        else:
-            print_fail("Found absolute references:", json_output)
-            for issue in msg:
-                print(f"      - {issue}")
-            has_errors = True
-    
-    # Section 9: Registry & Map Consistency
-    if run_registry_checks:
-        print_info("\n=== Registry & Map Consistency ===", json_output)
+                if not any(name.endswith('.py') for name in changed):
+                    skipped_checks.update((check_encoding_safety, check_subprocess_robustness,
+                                           check_risky_path_ops, check_cross_platform_compatibility))
+                if not any(Path(name).name == 'SKILL.md' for name in changed):
+                    skipped_checks.update((validate_frontmatter, check_skill_name_consistency))
+                print_verbose(f"Changed files: {len(changed)}, skipped checks: {len(skipped_checks)}", verbose)
+    
+        issues = []
+        results = {}
+        for index, (section, enabled, checks) in enumerate(sections):
+            checks = [entry for entry in checks if entry[0] not in skipped_checks]
+            if not enabled or not checks:
+                continue
+            print_info(("\n" if index else "") + f"=== {section} ===", json_output)
         
-        ok, msg = check_registry_consistency(skill_path, skills_dir)
-        if ok:
-            print_pass(msg, json_output)
-        else:
-            print_fail("Registry consistency issues:", json_output)
-            if isinstance(msg, list):
-                for issue in msg: print(f"      - {issue}")
-            else:
-                print(f"      - {msg}")
-            has_warnings = True
+            section_issues = []
+            for check, fail_header, severity in checks:
+                ok, msg = check(skill_path)
+                if ok:
+                    print_pass(msg, json_output)
+                    continue
+            
+                # Failures are a list of Issue records or a single inline message
+                found = msg if isinstance(msg, list) else [Issue(text=msg)]
+                for issue in found:
+                    issue.severity = severity
+                    issue.section = section
+                section_issues.extend(found)
+                report = print_fail if severity == "error" else print_warn
+                if fail_header is None and not isinstance(msg, list):
+                    report(msg, json_output)
+                else:
+                    report(fail_header, json_output)
+                    for issue in found:
+                        print_info(f"      - {issue}", json_output)
         
-        ok, msg = check_skill_map_consistency(skill_path, skills_dir)
-        if ok:
-            print_pass(msg, json_output)
+            issues.extend(section_issues)
+            results[section] = {
+                "pass": not any(issue.severity == "error" for issue in section_issues),
+                "issues": [asdict(issue) for issue in section_issues]
+            }
+    
+        has_errors = any(issue.severity == "error" for issue in issues)
+        has_warnings = any(issue.severity == "warning" for issue in issues)
+    
+        if json_output:
+            _emit(generate_json_report(skill_path, results))
+            return not has_errors
+    
+        _emit("\n" + "="*40)
+        if has_errors:
+            _emit(f"{RED}[!] Audit completed with errors. Please fix issues above.{RESET}")
+            return False
+        elif has_warnings:
+            _emit(f"{YELLOW}[!] Audit completed with warnings. Review issues above.{RESET}")
+            return True
         else:
-            print_fail("Skill map consistency issues:", json_output)
-            if isinstance(msg, list):
-                for issue in msg: print(f"      - {issue}")
-            else:
-                print(f"      - {msg}")
-            has_warnings = True
-    
-    print("\n" + "="*40)
-    if has_errors:
-        print(f"{RED}[!] Audit completed with errors. Please fix issues above.{RESET}")
-        return False
-    elif has_warnings:
-        print(f"{YELLOW}[!] Audit completed with warnings. Review issues above.{RESET}")
-        return True
-    else:
-        print(f"{GREEN}[*] Skill passed all standard checks!{RESET}")
-        return True
+            _emit(f"{GREEN}[*] Skill passed all standard checks!{RESET}")
+            return True
+    finally:
+        flush_report()
 
 def check_risky_path_ops(skill_path):
     """
@@ -617,7 +648,7 @@ def check_risky_path_ops(skill_path):
     
     for py_file in skill_path.glob('**/*.py'):
         try:
-            content = py_file.read_text(encoding='utf-8')
+            content = _read_text(py_file)
             lines = content.splitlines()
             
             for i, line in enumerate(lines, 1):
@@ -639,7 +670,7 @@ def check_risky_path_ops(skill_path):
                 # Match actual function calls, not string literals
                 os_system_pattern = r'\bos\.system\s*\('
                 if re.search(os_system_pattern, line):
-                    issues.append(f"{py_file.name}:{i}: Use of os.system() detected. Prefer subprocess.run() for better control and security.")
+                    issues.append(Issue(path=py_file.name, line=i, text="Use of os.system() detected. Prefer subprocess.run() for better control and security."))
                     
                 # Check for hardcoded separators in string literals that look like paths
                 # This is tricky to regex perfectly, looking for common patterns
@@ -649,7 +680,7 @@ def check_risky_path_ops(skill_path):
                 # Skipping for now to avoid noise, focusing on high-impact os.system
                 
         except Exception as e:
-            issues.append(f"Could not read {py_file.name}: {e}")
+            issues.append(Issue(text=f"Could not read {py_file.name}: {e}"))
             
     if issues:
         return False, issues
@@ -682,7 +713,7 @@ def check_subprocess_robustness(skill_path):
         if py_file.name == 'audit_skill.py':
             continue
         try:
-            content = py_file.read_text(encoding='utf-8')
+            content = _read_text(py_file)
             lines = content.splitlines()
             
             for i, line in enumerate(lines, 1):
@@ -695,9 +726,9 @@ def check_subprocess_robustness(skill_path):
                     if 'capture_output=True' in line or 'stdout=subprocess.PIPE' in line:
                         if 'text=True' in line or 'encoding=' in line:
                             if 'errors=' not in line:
-                                issues.append(f"{py_file.name}:{i}: Subprocess call might crash on non-UTF8 output (missing errors='replace' or similar)")
+                                issues.append(Issue(path=py_file.name, line=i, text="Subprocess call might crash on non-UTF8 output (missing errors='replace' or similar)"))
         except Exception as e:
-            issues.append(f"Could not read {py_file.name}: {e}")
+            issues.append(Issue(text=f"Could not read {py_file.name}: {e}"))
             
     if issues:
         return False, issues
@@ -729,7 +760,7 @@ def check_cross_platform_compatibility(skill_path):
         if py_file.name == 'audit_skill.py':
             continue
         try:
-            content = py_file.read_text(encoding='utf-8')
+            content = _read_text(py_file)
             lines = content.splitlines()
             
             for i, line in enumerate(lines, 1):
@@ -751,17 +782,17 @@ def check_cross_platform_compatibility(skill_path):
                 platform_commands = ['dir ', 'del ', 'ls ', 'rm ', 'rmdir ']
                 for cmd in platform_commands:
                     if ('"' + cmd + ' "') in line or ("'" + cmd + " '") in line:
-                        issues.append(f"{py_file.name}:{i}: Platform-specific command '{cmd}' detected. Use pathlib or shutil for cross-platform compatibility.")
+                        issues.append(Issue(path=py_file.name, line=i, text=f"Platform-specific command '{cmd}' detected. Use pathlib or shutil for cross-platform compatibility."))
                 
                 # Check for absolute path patterns in string literals
                 # Windows absolute paths
                 if re.search(r'["\']C:\\\\', line):
-                    issues.append(f"{py_file.name}:{i}: Hardcoded Windows absolute path detected. Use relative paths.")
+                    issues.append(Issue(path=py_file.name, line=i, text="Hardcoded Windows absolute path detected. Use relative paths."))
                 # Unix absolute paths
                 if re.search(r'["\']/home/', line):
-                    issues.append(f"{py_file.name}:{i}: Hardcoded Unix absolute path detected. Use relative paths.")
+                    issues.append(Issue(path=py_file.name, line=i, text="Hardcoded Unix absolute path detected. Use relative paths."))
                 if re.search(r'["\']/Users/', line):
-                    issues.append(f"{py_file.name}:{i}: Hardcoded macOS absolute path detected. Use relative paths.")
+                    issues.append(Issue(path=py_file.name, line=i, text="Hardcoded macOS absolute path detected. Use relative paths."))
                 
                 # Check for hardcoded path separators in string literals that look like paths
                 # This is a heuristic - look for patterns like "folder/file" or "folder\\file"
@@ -770,10 +801,10 @@ def check_cross_platform_compatibility(skill_path):
                     continue
                 # Check for mixed separators (Windows style in Unix context or vice versa)
                 if '/' in line and '\\\\' in line and 'path' in line.lower():
-                    issues.append(f"{py_file.name}:{i}: Mixed path separators detected. Use pathlib for cross-platform paths.")
+                    issues.append(Issue(path=py_file.name, line=i, text="Mixed path separators detected. Use pathlib for cross-platform paths."))
                     
         except Exception as e:
-            issues.append(f"Could not read {py_file.name}: {e}")
+            issues.append(Issue(text=f"Could not read {py_file.name}: {e}"))
             
     if issues:
         return False, issues
@@ -801,7 +832,7 @@ def check_i18n_support(skill_path):
     skill_md = skill_path / 'SKILL.md'
     if skill_md.exists():
         try:
-            content = skill_md.read_text(encoding='utf-8')
+            content = _read_text(skill_md)
             
             # Check for both English and Chinese keywords
             has_english = any(word in content.lower() for word in ['description:', 'name:', 'usage:', 'example'])
@@ -810,15 +841,15 @@ def check_i18n_support(skill_path):
             # This is just a suggestion, not a requirement
             # Note: encoding='utf-8' is recommended for Chinese files but not mandatory
             if not has_chinese and not has_english:
-                issues.append("Suggestion: Consider adding both English and Chinese keywords in SKILL.md for better discoverability.")
+                issues.append(Issue(text="Suggestion: Consider adding both English and Chinese keywords in SKILL.md for better discoverability."))
                 
         except Exception as e:
-            issues.append(f"Could not read SKILL.md: {e}")
+            issues.append(Issue(text=f"Could not read SKILL.md: {e}"))
     
     # Check Python files for hardcoded output messages
     for py_file in skill_path.glob('**/*.py'):
         try:
-            content = py_file.read_text(encoding='utf-8')
+            content = _read_text(py_file)
             lines = content.splitlines()
             
             message_count = 0
@@ -856,14 +887,14 @@ def check_i18n_support(skill_path):
                             if emoji_in_comment:
                                 continue
                         
-                        issues.append(f"{py_file.name}:{i}: Emoji found in output statement. Emoji is not allowed in skill code. Use standard text labels [PASS]/[FAIL]/[WARN]/[INFO] instead.")
+                        issues.append(Issue(path=py_file.name, line=i, text="Emoji found in output statement. Emoji is not allowed in skill code. Use standard text labels [PASS]/[FAIL]/[WARN]/[INFO] instead."))
             
             # Warn if many hardcoded messages (informational only)
             if message_count > 20:
-                issues.append(f"Suggestion: {py_file.name} has {message_count} print statements. Consider using a message dictionary for better i18n support when applicable.")
+                issues.append(Issue(text=f"Suggestion: {py_file.name} has {message_count} print statements. Consider using a message dictionary for better i18n support when applicable."))
                     
         except Exception as e:
-            issues.append(f"Could not read {py_file.name}: {e}")
+            issues.append(Issue(text=f"Could not read {py_file.name}: {e}"))
             
     if issues:
         return False, issues
@@ -888,7 +919,7 @@ def check_absolute_references(skill_path):
     
     for py_file in skill_path.glob('**/*.py'):
         try:
-            content = py_file.read_text(encoding='utf-8')
+            content = _read_text(py_file)
             lines = content.splitlines()
             
             for i, line in enumerate(lines, 1):
@@ -905,34 +936,52 @@ def check_absolute_references(skill_path):
                 # Check for absolute path patterns in file operations
                 # Look for patterns like open('/path/to/file') or Path('/path/to/file')
                 if re.search(r'open\s*\(\s*["\'][/A-Za-z]', line):
-                    issues.append(f"{py_file.name}:{i}: Absolute path in open() call. Use relative paths.")
+                    issues.append(Issue(path=py_file.name, line=i, text="Absolute path in open() call. Use relative paths."))
                 if re.search(r'Path\s*\(\s*["\'][/A-Za-z]', line):
-                    issues.append(f"{py_file.name}:{i}: Absolute path in Path() constructor. Use relative paths.")
+                    issues.append(Issue(path=py_file.name, line=i, text="Absolute path in Path() constructor. Use relative paths."))
                 
                 # Check for hardcoded absolute paths in string assignments
                 if re.search(r'=\s*["\'][A-Z]:\\\\', line):
-                    issues.append(f"{py_file.name}:{i}: Hardcoded Windows absolute path detected.")
+                    issues.append(Issue(path=py_file.name, line=i, text="Hardcoded Windows absolute path detected."))
                 if re.search(r'=\s*["\']/[a-z]+/', line):
-                    issues.append(f"{py_file.name}:{i}: Hardcoded Unix absolute path detected.")
+                    issues.append(Issue(path=py_file.name, line=i, text="Hardcoded Unix absolute path detected."))
                     
         except Exception as e:
-            issues.append(f"Could not read {py_file.name}: {e}")
+            issues.append(Issue(text=f"Could not read {py_file.name}: {e}"))
     
     # Check for absolute paths in config files
     for config_file in skill_path.glob('**/*.json'):
         try:
-            content = config_file.read_text(encoding='utf-8')
+            content = _read_text(config_file)
             if re.search(r'["\'][A-Z]:\\\\', content):
-                issues.append(f"{config_file.relative_to(skill_path)}: Contains Windows absolute path.")
+                issues.append(Issue(path=str(config_file.relative_to(skill_path)), text="Contains Windows absolute path."))
             if re.search(r'["\']/[a-z]+/home/', content):
-                issues.append(f"{config_file.relative_to(skill_path)}: Contains Unix absolute path.")
+                issues.append(Issue(path=str(config_file.relative_to(skill_path)), text="Contains Unix absolute path."))
         except Exception as e:
-            issues.append(f"Could not read {config_file.name}: {e}")
+            issues.append(Issue(text=f"Could not read {config_file.name}: {e}"))
             
     if issues:
         return False, issues
     return True, "No absolute references found"
 
+@functools.lru_cache(maxsize=4)
+def _load_json(path_str, mtime_ns):
+    """
+    Parse a JSON file, memoized on (path, mtime) so that auditing many skills
+    in one process parses skills.json and skill_map.json only once.
+    """
+    data = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _load_json_file(json_file):
+    """Load a JSON file through the mtime-keyed cache, or None if unavailable."""
+    try:
+        return _load_json(str(json_file), json_file.stat().st_mtime_ns)
+    except Exception:
+        return None
+
 def get_skills_registry(skills_dir):
     """
     Load skills.json registry file.
@@ -943,16 +992,7 @@ def get_skills_registry(skills_dir):
     Returns:
         dict: Registry data or None if not found
     """
-    skills_dir = Path(skills_dir)
-    registry_file = skills_dir / 'skills.json'
-    if not registry_file.exists():
-        return None
-    
-    try:
-        with open(registry_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception:
-        return None
+    return _load_json_file(Path(skills_dir) / 'skills.json')
 
 def get_skill_map(skills_dir):
     """
@@ -964,16 +1004,7 @@ def get_skill_map(skills_dir):
     Returns:
         dict: Skill map data or None if not found
     """
-    skills_dir = Path(skills_dir)
-    map_file = skills_dir / 'skill_map.json'
-    if not map_file.exists():
-        return None
-    
-    try:
-        with open(map_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception:
-        return None
+    return _load_json_file(Path(skills_dir) / 'skill_map.json')
 
 def check_registry_consistency(skill_path, skills_dir):
     """
@@ -1009,21 +1040,21 @@ def check_registry_consistency(skill_path, skills_dir):
     
     # Check source field
     if "source" not in skill_info:
-        issues.append("Missing 'source' field in registry")
+        issues.append(Issue(text="Missing 'source' field in registry"))
     elif skill_info["source"] not in ["local", "unknown"]:
         if not skill_info["source"].startswith(("http://", "https://")):
-            issues.append(f"Invalid source URL: {skill_info['source']}")
+            issues.append(Issue(text=f"Invalid source URL: {skill_info['source']}"))
     
     # Check version field
     if "version" not in skill_info:
-        issues.append("Missing 'version' field in registry")
+        issues.append(Issue(text="Missing 'version' field in registry"))
     elif skill_info["version"] == "unknown":
         if skill_info.get("source") not in ["local", "unknown"]:
-            issues.append("Remote skill has 'unknown' version (should use commit hash)")
+            issues.append(Issue(text="Remote skill has 'unknown' version (should use commit hash)"))
     
     # Check updated_at field
     if "updated_at" not in skill_info:
-        issues.append("Missing 'updated_at' field in registry")
+        issues.append(Issue(text="Missing 'updated_at' field in registry"))
     else:
         try:
             updated_at = datetime.datetime.fromisoformat(skill_info["updated_at"])
@@ -1034,9 +1065,9 @@ def check_registry_consistency(skill_path, skills_dir):
                 updated_at = updated_at.replace(tzinfo=datetime.timezone.utc)
             age = now - updated_at
             if age > datetime.timedelta(days=365):
-                issues.append(f"Registry entry is old ({age.days} days), consider updating")
+                issues.append(Issue(text=f"Registry entry is old ({age.days} days), consider updating"))
         except ValueError:
-            issues.append(f"Invalid updated_at format: {skill_info['updated_at']}")
+            issues.append(Issue(text=f"Invalid updated_at format: {skill_info['updated_at']}"))
     
     if issues:
         return False, issues
@@ -1076,15 +1107,15 @@ def check_skill_map_consistency(skill_path, skills_dir):
     
     # Check keywords
     if "keywords" not in skill_entry:
-        issues.append("Missing 'keywords' field in skill_map.json")
+        issues.append(Issue(text="Missing 'keywords' field in skill_map.json"))
     elif not skill_entry["keywords"]:
-        issues.append("Empty 'keywords' list in skill_map.json")
+        issues.append(Issue(text="Empty 'keywords' list in skill_map.json"))
     
     # Check name field
     if "name" not in skill_entry:
-        issues.append("Missing 'name' field in skill_map.json")
+        issues.append(Issue(text="Missing 'name' field in skill_map.json"))
     elif skill_entry["name"] != skill_name:
-        issues.append(f"Name mismatch: skill_map.json has '{skill_entry['name']}' but directory is '{skill_name}'")
+        issues.append(Issue(text=f"Name mismatch: skill_map.json has '{skill_entry['name']}' but directory is '{skill_name}'"))
     
     if issues:
         return False, issues
@@ -1115,7 +1146,7 @@ def parse_arguments():
     Parse command line arguments.
     
     Returns:
-        tuple: (skill_path, skills_dir, verbose, json_output, check_level)
+        tuple: (skill_path, skills_dir, verbose, json_output, check_level, changed_only)
     """
     parser = argparse.ArgumentParser(
         description="Audit Trae skills for compliance and best practices",
@@ -1152,6 +1183,12 @@ def parse_arguments():
         help="Check level: strict (all checks), standard (recommended), relaxed (minimal)"
     )
     
+    parser.add_argument(
+        "-c", "--changed-only",
+        action="store_true",
+        help="Only run file-content checks for files changed since git HEAD"
+    )
+    
     args = parser.parse_args()
     
     return (
@@ -1159,11 +1196,12 @@ def parse_arguments():
         args.skills_dir,
         args.verbose,
         args.json,
-        args.level
+        args.level,
+        args.changed_only
     )
 
 if __name__ == "__main__":
-    skill_path, skills_dir, verbose, json_output, check_level = parse_arguments()
+    skill_path, skills_dir, verbose, json_output, check_level, changed_only = parse_arguments()
     
     if not json_output:
         print(f"[*] Auditing Skill: {Path(skill_path).name}")
@@ -1178,6 +1216,7 @@ if __name__ == "__main__":
         skills_dir, 
         verbose=verbose, 
         json_output=json_output, 
-        check_level=check_level
+        check_level=check_level,
+        changed_only=changed_only
     )
     sys.exit(0 if success else 1)
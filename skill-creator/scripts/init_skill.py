@@ -15,7 +15,15 @@ import sys
 import os
 import json
 import datetime
+import functools
+import string
 from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from messages import *
 except ImportError:
@@ -29,19 +37,19 @@ except ImportError:
     COLOR_BLUE = "\033[94m"
     COLOR_CYAN = "\033[96m"
     COLOR_RESET = "\033[0m"
-    MSG_INITIALIZING = f"{ICON_INFO} Initializing skill: {skill_name}"
-    MSG_LOCATION = f"   Location: {path}"
-    MSG_DIR_EXISTS = f"{COLOR_RED}[FAIL] Error: Skill directory already exists: {skill_dir}{COLOR_RESET}"
-    MSG_DIR_CREATED = f"{COLOR_GREEN}[PASS] Created skill directory: {skill_dir}{COLOR_RESET}"
-    MSG_DIR_CREATE_ERROR = f"{COLOR_RED}[FAIL] Error creating directory: {e}{COLOR_RESET}"
+    MSG_INITIALIZING = f"{ICON_INFO} Initializing skill: {{skill_name}}"
+    MSG_LOCATION = f"   Location: {{path}}"
+    MSG_DIR_EXISTS = f"{COLOR_RED}[FAIL] Error: Skill directory already exists: {{skill_dir}}{COLOR_RESET}"
+    MSG_DIR_CREATED = f"{COLOR_GREEN}[PASS] Created skill directory: {{skill_dir}}{COLOR_RESET}"
+    MSG_DIR_CREATE_ERROR = f"{COLOR_RED}[FAIL] Error creating directory: {{e}}{COLOR_RESET}"
     MSG_SKILL_MD_CREATED = f"{COLOR_GREEN}[PASS] Created SKILL.md{COLOR_RESET}"
-    MSG_SKILL_MD_ERROR = f"{COLOR_RED}[FAIL] Error creating SKILL.md: {e}{COLOR_RESET}"
+    MSG_SKILL_MD_ERROR = f"{COLOR_RED}[FAIL] Error creating SKILL.md: {{e}}{COLOR_RESET}"
     MSG_SCRIPT_CREATED = f"{COLOR_GREEN}[PASS] Created scripts/example.py{COLOR_RESET}"
     MSG_REQUIREMENTS_CREATED = f"{COLOR_GREEN}[PASS] Created scripts/requirements.txt{COLOR_RESET}"
     MSG_REFERENCE_CREATED = f"{COLOR_GREEN}[PASS] Created references/api_reference.md{COLOR_RESET}"
     MSG_ASSET_CREATED = f"{COLOR_GREEN}[PASS] Created assets/example_asset.txt{COLOR_RESET}"
-    MSG_RESOURCE_ERROR = f"{COLOR_RED}[FAIL] Error creating resource directories: {e}{COLOR_RESET}"
-    MSG_INIT_SUCCESS = f"{COLOR_GREEN}[PASS] Skill '{skill_name}' initialized successfully at {skill_dir}{COLOR_RESET}"
+    MSG_RESOURCE_ERROR = f"{COLOR_RED}[FAIL] Error creating resource directories: {{e}}{COLOR_RESET}"
+    MSG_INIT_SUCCESS = f"{COLOR_GREEN}[PASS] Skill '{{skill_name}}' initialized successfully at {{skill_dir}}{COLOR_RESET}"
     MSG_NEXT_STEPS = f"\n{ICON_INFO} Next steps:"
     MSG_STEP_1 = "1. Edit SKILL.md to complete TODO items and update description"
     MSG_STEP_2 = "2. Customize or delete example files in scripts/, references/, and assets/"
@@ -161,7 +169,7 @@ Examples:
 """
 
 EXAMPLE_SCRIPT = """#!/usr/bin/env python3
-"""
+'''
 Example helper script for {skill_name}
 
 This is a placeholder script that can be executed directly.
@@ -170,9 +178,12 @@ Replace with actual implementation or delete if not needed.
 Example real scripts from other skills:
 - pdf/scripts/fill_fillable_fields.py - Fills PDF form fields
 - pdf/scripts/convert_pdf_to_images.py - Converts PDF pages to images
-"""
+'''
+
+from pathlib import Path
 
 def main():
+    assets_dir = Path(__file__).parent.parent / 'assets'
     print(f"Running {{Path(__file__).name}}...")
     print(f"Assets directory: {{assets_dir}}")
     
@@ -252,103 +263,181 @@ EXAMPLE_REQUIREMENTS = """# Dependencies for {skill_name}
 # pandas>=1.2.0
 """
 
+def compile_template(template):
+    """
+    Pre-parse a str.format template into a render function.
+
+    The template is split into literal text and field names once, so each
+    render is a single join instead of re-parsing the format string.
+
+    Args:
+        template: Template string using {field} placeholders
+
+    Returns:
+        Function taking the fields as keyword arguments and returning the rendered text
+    """
+    parts = tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(template))
+
+    def render(**fields):
+        return ''.join(literal + fields[field] if field is not None else literal for literal, field in parts)
+    return render
+
+render_skill_md = compile_template(SKILL_TEMPLATE)
+render_example_script = compile_template(EXAMPLE_SCRIPT)
+render_example_reference = compile_template(EXAMPLE_REFERENCE)
+render_example_requirements = compile_template(EXAMPLE_REQUIREMENTS)
+
+@functools.lru_cache(maxsize=1024)
 def title_case_skill_name(skill_name):
     """Convert hyphenated skill name to Title Case for display."""
     return ' '.join(word.capitalize() for word in skill_name.split('-'))
 
-def update_registry(dest_root, skill_name):
-    """Update the skills.json registry file with new skill."""
-    registry_path = dest_root / 'skills.json'
-    registry = {'skills': {}}
-    
-    if registry_path.exists():
-        try:
-            content = registry_path.read_text(encoding='utf-8')
-            registry = json.loads(content)
-        except Exception as e:
-            print(f"Warning: Could not read skills.json: {e}")
-    
-    registry['skills'][skill_name] = {
+def load_json_file(json_path, default):
+    """
+    Load a JSON file, falling back to a default if it is missing or unreadable.
+
+    Args:
+        json_path: Path to the JSON file
+        default: Value to return when the file cannot be loaded
+
+    Returns:
+        Parsed JSON data, or default
+    """
+    if not json_path.exists():
+        return default
+    try:
+        # Both parsers accept raw UTF-8 bytes, so no str decode pass is needed
+        data = json_path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except Exception as e:
+        print(f"Warning: Could not read {json_path.name}: {e}")
+        return default
+
+def dumps_json(data):
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def write_json_file(json_path, data, skill_names):
+    """Write JSON data to disk and report which skills were added."""
+    try:
+        json_path.write_bytes(dumps_json(data))
+        names = "', '".join(skill_names)
+        print(f"Updated {json_path.name} with '{names}'")
+    except Exception as e:
+        print(f"Warning: Could not update {json_path.name}: {e}")
+
+def update_registry(registry, skill_name, now_iso):
+    """
+    Add a new skill to an already-loaded skills.json registry.
+
+    Args:
+        registry: Registry dict loaded from skills.json
+        skill_name: Name of the skill
+        now_iso: ISO timestamp to record as updated_at
+
+    Returns:
+        The updated registry dict
+    """
+    registry.setdefault('skills', {})[skill_name] = {
         'source': 'local',
         'subdir': '',
         'version': 'unknown',
-        'updated_at': datetime.datetime.now().isoformat()
+        'updated_at': now_iso
     }
-    
-    try:
-        registry_path.write_text(json.dumps(registry, indent=2), encoding='utf-8')
-        print(f"Updated skills.json with '{skill_name}'")
-    except Exception as e:
-        print(f"Warning: Could not update skills.json: {e}")
+    return registry
 
-def update_skill_map(dest_root, skill_name, skill_dir):
-    """Update the skill_map.json file with new skill metadata."""
-    skill_map_path = dest_root / 'skill_map.json'
-    skill_map = {'skills': {}, 'detection_rules': {'priority_order': [], 'exact_match': {}, 'partial_match': {}}}
-    
-    if skill_map_path.exists():
-        try:
-            content = skill_map_path.read_text(encoding='utf-8')
-            skill_map = json.loads(content)
-        except Exception as e:
-            print(f"Warning: Could not read skill_map.json: {e}")
-    
+def update_skill_map(skill_map, skill_name, skill_dir):
+    """
+    Add new skill metadata to an already-loaded skill_map.json.
+
+    Args:
+        skill_map: Skill map dict loaded from skill_map.json
+        skill_name: Name of the skill
+        skill_dir: Path to the skill directory
+
+    Returns:
+        The updated skill map dict
+    """
+    skill_name_spaced = skill_name.replace('-', ' ')
     skill_map['skills'][skill_name] = {
         'name': skill_name,
         'description': f"TODO: Add description for {skill_name}",
-        'keywords': [skill_name.replace('-', ' ')],
+        'keywords': [skill_name_spaced],
         'aliases': [skill_name]
     }
     
     if skill_name not in skill_map['detection_rules']['priority_order']:
         skill_map['detection_rules']['priority_order'].append(skill_name)
     
-    skill_name_lower = skill_name.lower().replace('-', ' ')
-    skill_map['detection_rules']['exact_match'][skill_name_lower] = skill_name
-    
+    # Names should already be lowercase, but init does not enforce it
+    skill_map['detection_rules']['exact_match'][skill_name_spaced.lower()] = skill_name
+    return skill_map
+
+# Flags for creating template files; O_BINARY keeps the Windows C runtime from
+# translating newlines a second time (write_file already uses os.linesep)
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def write_file(file_path, content, mode=0o644):
+    """
+    Write a UTF-8 text file given as a plain path string.
+
+    The content is encoded once and written with a single os.write on a raw
+    descriptor, and the permission bits are applied at creation time. Newlines
+    are translated to os.linesep first, as Path.write_text does, so Windows
+    still gets CRLF line endings.
+
+    Args:
+        file_path: Path string of the file to create
+        content: Text to write
+        mode: Permission bits for the new file (subject to the umask)
+    """
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(file_path, WRITE_FLAGS, mode)
     try:
-        skill_map_path.write_text(json.dumps(skill_map, indent=2, ensure_ascii=False), encoding='utf-8')
-        print(f"Updated skill_map.json with '{skill_name}'")
-    except Exception as e:
-        print(f"Warning: Could not update skill_map.json: {e}")
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
-def init_skill(skill_name, path):
+def create_skill_files(skill_name, dest_root):
     """
-    Initialize a new skill directory with template SKILL.md.
+    Create a new skill directory with template SKILL.md and example resources.
 
     Args:
         skill_name: Name of the skill
-        path: Path where the skill directory should be created
+        dest_root: Resolved Path where the skill directory should be created
 
     Returns:
         Path to created skill directory, or None if error
     """
     # Determine skill directory path
-    skill_dir = Path(path).resolve() / skill_name
-
-    # Check if directory already exists
-    if skill_dir.exists():
-        print(MSG_DIR_EXISTS.format(skill_dir=skill_dir))
-        return None
+    skill_dir = dest_root / skill_name
+    skill_dir_s = str(skill_dir)
 
-    # Create skill directory
+    # Create skill directory (fails if it already exists)
     try:
-        skill_dir.mkdir(parents=True, exist_ok=False)
+        os.makedirs(skill_dir_s)
         print(MSG_DIR_CREATED.format(skill_dir=skill_dir))
+    except FileExistsError:
+        print(MSG_DIR_EXISTS.format(skill_dir=skill_dir))
+        return None
     except Exception as e:
         print(MSG_DIR_CREATE_ERROR.format(e=e))
         return None
 
     # Create SKILL.md from template
     skill_title = title_case_skill_name(skill_name)
-    skill_content = SKILL_TEMPLATE.format(
+    skill_content = render_skill_md(
         skill_name=skill_name,
         skill_title=skill_title
     )
 
-    skill_md_path = skill_dir / 'SKILL.md'
     try:
-        skill_md_path.write_text(skill_content, encoding='utf-8')
+        write_file(os.path.join(skill_dir_s, 'SKILL.md'), skill_content)
         print(MSG_SKILL_MD_CREATED)
     except Exception as e:
         print(MSG_SKILL_MD_ERROR.format(e=e))
@@ -357,49 +446,97 @@ def init_skill(skill_name, path):
     # Create resource directories with example files
     try:
         # Create scripts/ directory with example script
-        scripts_dir = skill_dir / 'scripts'
-        scripts_dir.mkdir(exist_ok=True)
-        example_script = scripts_dir / 'example.py'
-        example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name), encoding='utf-8')
-        if os.name != 'nt':
-            example_script.chmod(0o755)
+        scripts_dir = os.path.join(skill_dir_s, 'scripts')
+        os.makedirs(scripts_dir, exist_ok=True)
+        example_script = os.path.join(scripts_dir, 'example.py')
+        write_file(example_script, render_example_script(skill_name=skill_name), mode=0o755)
         print(MSG_SCRIPT_CREATED)
 
         # Create scripts/requirements.txt
-        requirements_file = scripts_dir / 'requirements.txt'
-        requirements_file.write_text(EXAMPLE_REQUIREMENTS.format(skill_name=skill_name), encoding='utf-8')
+        write_file(os.path.join(scripts_dir, 'requirements.txt'), render_example_requirements(skill_name=skill_name))
         print(MSG_REQUIREMENTS_CREATED)
 
         # Create references/ directory with example reference doc
-        references_dir = skill_dir / 'references'
-        references_dir.mkdir(exist_ok=True)
-        example_reference = references_dir / 'api_reference.md'
-        example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title), encoding='utf-8')
+        references_dir = os.path.join(skill_dir_s, 'references')
+        os.makedirs(references_dir, exist_ok=True)
+        write_file(os.path.join(references_dir, 'api_reference.md'), render_example_reference(skill_title=skill_title))
         print(MSG_REFERENCE_CREATED)
 
         # Create assets/ directory with example asset placeholder
-        assets_dir = skill_dir / 'assets'
-        assets_dir.mkdir(exist_ok=True)
-        example_asset = assets_dir / 'example_asset.txt'
-        example_asset.write_text(EXAMPLE_ASSET, encoding='utf-8')
+        assets_dir = os.path.join(skill_dir_s, 'assets')
+        os.makedirs(assets_dir, exist_ok=True)
+        write_file(os.path.join(assets_dir, 'example_asset.txt'), EXAMPLE_ASSET)
         print(MSG_ASSET_CREATED)
     except Exception as e:
         print(MSG_RESOURCE_ERROR.format(e=e))
         return None
 
+    return skill_dir
+
+def init_skills_bulk(pairs):
+    """
+    Initialize several skills, updating skills.json and skill_map.json once.
+
+    Each destination root's registry files are read a single time, updated
+    in memory for every skill created under it, then written back once.
+
+    Args:
+        pairs: list of (skill_name, path) tuples
+
+    Returns:
+        list of created skill directories (None for skills that failed)
+    """
+    now_iso = datetime.datetime.now().isoformat()
+    results = []
+    created = {}  # dest_root -> [(skill_name, skill_dir)]
+
+    for skill_name, path in pairs:
+        dest_root = Path(path).resolve()
+        skill_dir = create_skill_files(skill_name, dest_root)
+        results.append(skill_dir)
+        if skill_dir:
+            created.setdefault(dest_root, []).append((skill_name, skill_dir))
+
     # Update skills.json and skill_map.json
-    dest_root = Path(path).resolve()
-    update_registry(dest_root, skill_name)
-    update_skill_map(dest_root, skill_name, skill_dir)
+    for dest_root, skills in created.items():
+        names = [skill_name for skill_name, _ in skills]
+
+        registry_path = dest_root / 'skills.json'
+        registry = load_json_file(registry_path, {'skills': {}})
+        for skill_name in names:
+            update_registry(registry, skill_name, now_iso)
+        write_json_file(registry_path, registry, names)
+
+        skill_map_path = dest_root / 'skill_map.json'
+        skill_map = load_json_file(skill_map_path, {'skills': {}, 'detection_rules': {'priority_order': [], 'exact_match': {}, 'partial_match': {}}})
+        for skill_name, skill_dir in skills:
+            update_skill_map(skill_map, skill_name, skill_dir)
+        write_json_file(skill_map_path, skill_map, names)
+
+        for skill_name, skill_dir in skills:
+            print(MSG_INIT_SUCCESS.format(skill_name=skill_name, skill_dir=skill_dir))
 
     # Print next steps
-    print(MSG_INIT_SUCCESS.format(skill_name=skill_name, skill_dir=skill_dir))
-    print(MSG_NEXT_STEPS)
-    print(MSG_STEP_1)
-    print(MSG_STEP_2)
-    print(MSG_STEP_3)
+    if created:
+        print(MSG_NEXT_STEPS)
+        print(MSG_STEP_1)
+        print(MSG_STEP_2)
+        print(MSG_STEP_3)
 
-    return skill_dir
+    return results
+
+def init_skill(skill_name, path):
+    """
+    Initialize a new skill directory with template SKILL.md.
+
+    Args:
+        skill_name: Name of the skill
+        path: Path where the skill directory should be created
+
+    Returns:
+        Path to created skill directory, or None if error
+    """
+    return init_skills_bulk([(skill_name, path)])[0]
 
 def main():
     if len(sys.argv) < 4 or sys.argv[2] != '--path':
@@ -5,12 +5,25 @@ Backup Skills - 备份所有已安装的 Trae skills
 """
 
 import sys
+import os
+import collections
+import contextlib
 import json
 import datetime
-import zipfile
+import time
 import shutil
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 try:
     from messages import *
 except ImportError:
@@ -29,6 +42,11 @@ except ImportError:
         MSG_BACKUP_SUCCESS = f"{GREEN}Backed up {{name}} to {{path}}{RESET}"
         MSG_BACKUP_ALL_SUCCESS = f"{GREEN}Backed up all skills to {{path}}{RESET}"
         MSG_BACKUP_SIZE = f"Backup size: {{size:.2f}} MB"
+        MSG_BACKUP_FILE_COUNT = f"Files archived: {{count}}"
+        MSG_UNSAFE_BACKUP_PATH = f"{YELLOW}Warning: Skipping unsafe path in backup: {{path}}{RESET}"
+        MSG_SKILL_NOT_IN_BACKUP = f"{RED}Error: Skill '{{name}}' not found in backup.{RESET}"
+        MSG_BACKUP_UNCHANGED = f"{GREEN}No changes since last backup, keeping {{path}}{RESET}"
+        MSG_ZSTD_UNAVAILABLE = f"{RED}Error: zstd backups require the 'zstandard' package (pip install zstandard).{RESET}"
         MSG_NO_BACKUPS = "No backups found."
         MSG_AVAILABLE_BACKUPS = f"\n{BLUE}Available Backups:{RESET}"
         MSG_RESTORING = f"{CYAN}Restoring from {{name}}...{RESET}"
@@ -40,31 +58,278 @@ except ImportError:
         MSG_CLEANING_BACKUPS = f"{CYAN}Cleaning up old backups (keeping {{keep}} most recent)...{RESET}"
         MSG_REMOVED_BACKUP = f"{GREEN}Removed: {{name}}{RESET}"
 
+# install_skill (for remove_in_background) is imported only by restores
+if str(Path(__file__).parent) not in sys.path:
+    sys.path.append(str(Path(__file__).parent))
+
 SKILLS_DIR = Path(__file__).parent.parent.parent
 REGISTRY_FILE = SKILLS_DIR / 'skills.json'
 BACKUPS_DIR = SKILLS_DIR / 'backups'
 
+# Archive file extension for each backup codec
+CODEC_EXTENSIONS = {
+    'deflate': '.zip',
+    'zstd': '.tar.zst',
+}
+
 def load_registry():
     if not REGISTRY_FILE.exists():
         return {}
     try:
-        content = REGISTRY_FILE.read_text(encoding='utf-8')
-        return json.loads(content).get('skills', {})
+        data = REGISTRY_FILE.read_bytes()
+        registry = orjson.loads(data) if orjson is not None else json.loads(data)
+        return registry.get('skills', {})
     except Exception as e:
         print(f"{RED}Error reading skills.json: {e}{RESET}")
         return {}
 
-def create_backup(skill_name=None, output_dir=None):
+# Files up to this size are read and stored in one call; larger ones are streamed
+SMALL_FILE_LIMIT = 64 * 1024
+# Small-file reads queued ahead of the zip writer per worker thread; bounds
+# how many read files wait in memory at once
+READ_AHEAD_PER_WORKER = 4
+# Buffer size for the archive file handle so writes reach disk in large chunks
+WRITE_BUFFER_SIZE = 1 << 20
+# DEFLATE level used when none is given: backups are rewritten often, and
+# level 1 is several times faster than zlib's 6 for a few percent more size
+DEFAULT_DEFLATE_LEVEL = 1
+# Per-directory record of the last incremental backup of each scope
+MANIFEST_FILE = '.manifest.json'
+# Already-compressed formats that are stored as-is instead of DEFLATEd again
+NON_COMPRESSIBLE = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp',
+    '.woff', '.woff2', '.ttf', '.otf',
+    '.zip', '.gz', '.xz', '.zst',
+    '.pptx', '.docx', '.xlsx', '.pdf',
+})
+
+def iter_skill_files(root, prefix=None):
+    """
+    Walk a skill directory with os.scandir, skipping Python bytecode.
+    
+    Each file is stat'ed here once; archive writers and change detection
+    reuse that result (only large zip members are stat'ed again, by
+    ZipFile.write).
+    
+    Args:
+        root: Path of the directory to walk
+        prefix: Optional archive directory to place the relative paths under
+    
+    Yields:
+        (file_path, relative_path, stat_result) tuples, relative paths using '/'
+    """
+    stack = [(str(root), f"{prefix}/" if prefix else '')]
+    pop, push = stack.pop, stack.append
+    while stack:
+        directory, rel_dir = pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == '__pycache__' or name.endswith('.pyc'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    push((entry.path, f"{rel_dir}{name}/"))
+                elif entry.is_file():
+                    yield entry.path, rel_dir + name, entry.stat()
+
+def collect_skill_files(skill_path, prefix=None):
+    """
+    Collect the files of a skill directory for archiving.
+    
+    Args:
+        skill_path: Path to the skill directory
+        prefix: Optional archive directory to place the files under
+    
+    Returns:
+        list of (file_path, arcname, stat_result) tuples
+    """
+    return list(iter_skill_files(skill_path, prefix))
+
+def read_small_file(file_path, size):
+    """
+    Return the contents of a file below SMALL_FILE_LIMIT, or None for larger files.
+    
+    Args:
+        file_path: Path of the file to read
+        size: File size from the walker's stat, so the file is not stat'ed again
+    """
+    if size < SMALL_FILE_LIMIT:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    return None
+
+def read_ahead(pool, files, window):
+    """
+    Read small files on a thread pool, at most window files ahead of the consumer.
+    
+    Args:
+        pool: Executor running read_small_file
+        files: list of (file_path, arcname, stat_result) tuples
+        window: Maximum number of reads submitted but not yet consumed
+    
+    Yields:
+        ((file_path, arcname, stat_result), data) in input order; data is None
+        for files of SMALL_FILE_LIMIT or more
+    """
+    pending = collections.deque()
+    for entry in files:
+        pending.append((entry, pool.submit(read_small_file, entry[0], entry[2].st_size)))
+        if len(pending) >= window:
+            entry, future = pending.popleft()
+            yield entry, future.result()
+    while pending:
+        entry, future = pending.popleft()
+        yield entry, future.result()
+
+def sync_file(f):
+    """Flush a finished archive and fsync it once so the backup is durable."""
+    f.flush()
+    os.fsync(f.fileno())
+
+def write_zip_archive(backup_path, files, level=None):
+    """
+    Write collected files into a DEFLATE zip archive.
+    
+    Files in already-compressed formats are stored without recompression.
+    Small files are read ahead by a thread pool while the main thread
+    compresses, so disk reads overlap with zlib instead of alternating; the
+    read-ahead is bounded, so memory does not grow with the tree size.
+    
+    Args:
+        backup_path: Path of the zip file to create
+        files: list of (file_path, arcname, stat_result) tuples
+        level: DEFLATE level 0-9, or None for DEFAULT_DEFLATE_LEVEL
+    """
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+    if level is None:
+        level = DEFAULT_DEFLATE_LEVEL
+    workers = min(8, os.cpu_count() or 1)
+    with open(backup_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        with ThreadPoolExecutor(max_workers=workers) as pool, \
+                zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=level) as zipf:
+            for (file_path, arcname, st), data in read_ahead(pool, files, workers * READ_AHEAD_PER_WORKER):
+                ext = os.path.splitext(arcname)[1].lower()
+                compress_type = zipfile.ZIP_STORED if ext in NON_COMPRESSIBLE else zipfile.ZIP_DEFLATED
+                if data is not None:
+                    # Built from the walker's stat rather than ZipInfo.from_file(),
+                    # which would stat the file a second time
+                    info = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+                    info.external_attr = (st.st_mode & 0xFFFF) << 16
+                    info.compress_type = compress_type
+                    zipf.writestr(info, data, compresslevel=level)
+                else:
+                    # Large files are streamed by ZipFile.write(), the public
+                    # way to pass a compression level for a streamed member
+                    zipf.write(file_path, arcname, compress_type=compress_type, compresslevel=level)
+        sync_file(f)
+
+def write_zstd_archive(backup_path, files, level=None):
+    """
+    Write collected files into a zstd-compressed tar archive.
+    
+    The tar stream is written without seeking, straight into a multi-threaded
+    zstd compressor.
+    
+    Args:
+        backup_path: Path of the .tar.zst file to create
+        files: list of (file_path, arcname, stat_result) tuples
+        level: zstd level, or None for 3
+    """
+    import tarfile
+    compressor = zstandard.ZstdCompressor(level=level or 3, threads=-1)
+    with open(backup_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        with compressor.stream_writer(f, closefd=False) as writer, \
+                tarfile.open(fileobj=writer, mode='w|') as tar:
+            for file_path, arcname, _ in files:
+                tar.add(file_path, arcname=arcname, recursive=False)
+        sync_file(f)
+
+def write_archive(backup_path, files, codec='deflate', level=None):
+    """
+    Write collected files into an archive using the given codec.
+    
+    Args:
+        backup_path: Path of the archive to create
+        files: list of (file_path, arcname, stat_result) tuples
+        codec: 'deflate' for .zip or 'zstd' for .tar.zst
+        level: Compression level, or None for the codec default
+    """
+    if codec == 'zstd':
+        write_zstd_archive(backup_path, files, level)
+    else:
+        write_zip_archive(backup_path, files, level)
+
+def print_archived_files(files):
+    """List archived files with a single write instead of one print per file."""
+    sys.stdout.write(''.join(f"  Added: {arcname}\n" for _, arcname, _ in files))
+
+def file_signatures(files):
+    """Map each arcname to its [mtime_ns, size] for change detection."""
+    signatures = {}
+    for _, arcname, st in files:
+        signatures[arcname] = [st.st_mtime_ns, st.st_size]
+    return signatures
+
+def load_manifest(backup_dir):
+    """Load the incremental backup manifest of a backup directory, or {} if absent."""
+    manifest_path = backup_dir / MANIFEST_FILE
+    try:
+        data = manifest_path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+
+def find_unchanged_backup(backup_dir, scope, codec, signatures):
+    """
+    Find the previous backup of a scope if none of its files changed since.
+    
+    Args:
+        backup_dir: Directory holding the backups and manifest
+        scope: Skill name, or 'all_skills' for a full backup
+        codec: Codec the new backup would use
+        signatures: Current file signatures from file_signatures()
+    
+    Returns:
+        Path to the still-current backup, or None if a new one is needed
+    """
+    entry = load_manifest(backup_dir).get(scope)
+    if not entry or entry.get('codec') != codec or entry.get('files') != signatures:
+        return None
+    previous = backup_dir / entry['archive']
+    return previous if previous.exists() else None
+
+def record_backup(backup_dir, scope, codec, backup_path, signatures):
+    """Atomically record a finished backup in the backup directory's manifest."""
+    import tempfile
+    manifest = load_manifest(backup_dir)
+    manifest[scope] = {'archive': backup_path.name, 'codec': codec, 'files': signatures}
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=backup_dir,
+                                     prefix=MANIFEST_FILE, suffix='.tmp', delete=False) as tmp:
+        json.dump(manifest, tmp)
+    os.replace(tmp.name, backup_dir / MANIFEST_FILE)
+
+def create_backup(skill_name=None, output_dir=None, codec='deflate', verbose=False, level=None, incremental=False):
     """
     Create a backup of skills.
     
     Args:
         skill_name: Name of specific skill to backup, or None to backup all skills
         output_dir: Custom output directory, or None to use default BACKUPS_DIR
+        codec: 'deflate' for a .zip backup, or 'zstd' for a .tar.zst backup
+        verbose: List every archived file after the backup is written
+        level: Compression level 0-9 (1 = fastest), or None for the codec default
+        incremental: Skip the backup if nothing changed since the last incremental one
     
     Returns:
         Path to backup file, or None if failed
     """
+    from concurrent.futures import ThreadPoolExecutor
+    if codec == 'zstd' and zstandard is None:
+        print(MSG_ZSTD_UNAVAILABLE)
+        return None
+    extension = CODEC_EXTENSIONS[codec]
+    
     # Determine backup directory
     if output_dir:
         backup_dir = Path(output_dir)
@@ -83,22 +348,28 @@ def create_backup(skill_name=None, output_dir=None):
             print(f"{RED}Error: Skill '{skill_name}' not found.{RESET}")
             return None
         
-        backup_filename = f"{skill_name}_{timestamp}.zip"
+        backup_filename = f"{skill_name}_{timestamp}{extension}"
         backup_path = backup_dir / backup_filename
         
         print(MSG_BACKING_UP.format(name=skill_name))
         
         try:
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for file_path in skill_path.rglob('*'):
-                    if '__pycache__' in file_path.parts or file_path.suffix == '.pyc':
-                        continue
-                    
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(skill_path)
-                        zipf.write(file_path, arcname)
+            files = collect_skill_files(skill_path)
+            if incremental:
+                signatures = file_signatures(files)
+                previous = find_unchanged_backup(backup_dir, skill_name, codec, signatures)
+                if previous:
+                    print(MSG_BACKUP_UNCHANGED.format(path=previous))
+                    return previous
             
+            write_archive(backup_path, files, codec, level)
+            if incremental:
+                record_backup(backup_dir, skill_name, codec, backup_path, signatures)
+            
+            if verbose:
+                print_archived_files(files)
             print(MSG_BACKUP_SUCCESS.format(name=skill_name, path=backup_path))
+            print(MSG_BACKUP_FILE_COUNT.format(count=len(files)))
             return backup_path
         except Exception as e:
             print(f"{RED}Error backing up {skill_name}: {e}{RESET}")
@@ -110,30 +381,46 @@ def create_backup(skill_name=None, output_dir=None):
             print("No skills found in registry.")
             return None
         
-        backup_filename = f"all_skills_{timestamp}.zip"
+        backup_filename = f"all_skills_{timestamp}{extension}"
         backup_path = backup_dir / backup_filename
         
         print(MSG_BACKING_UP_ALL)
         print(f"Total skills: {len(skills)}")
         
         try:
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for skill_name in skills.keys():
-                    skill_path = SKILLS_DIR / skill_name
-                    if not skill_path.exists():
-                        print(f"{YELLOW}Warning: {skill_name} not found, skipping.{RESET}")
-                        continue
-                    
-                    for file_path in skill_path.rglob('*'):
-                        if '__pycache__' in file_path.parts or file_path.suffix == '.pyc':
-                            continue
-                        
-                        if file_path.is_file():
-                            arcname = Path(skill_name) / file_path.relative_to(skill_path)
-                            zipf.write(file_path, arcname)
-                            # print(f"  Added: {arcname}")
+            # One directory listing instead of an exists() check per registered skill
+            with os.scandir(SKILLS_DIR) as entries:
+                present = {entry.name: entry.path for entry in entries
+                           if entry.name in skills and entry.is_dir(follow_symlinks=False)}
+            
+            to_walk = []
+            for skill_name in skills.keys():
+                if skill_name not in present:
+                    print(f"{YELLOW}Warning: {skill_name} not found, skipping.{RESET}")
+                    continue
+                to_walk.append(skill_name)
+            
+            # Walk skill trees concurrently; map() keeps the registry order
+            files = []
+            with ThreadPoolExecutor(max_workers=min(8, len(to_walk) or 1)) as pool:
+                for skill_files in pool.map(lambda name: collect_skill_files(present[name], prefix=name), to_walk):
+                    files.extend(skill_files)
             
+            if incremental:
+                signatures = file_signatures(files)
+                previous = find_unchanged_backup(backup_dir, 'all_skills', codec, signatures)
+                if previous:
+                    print(MSG_BACKUP_UNCHANGED.format(path=previous))
+                    return previous
+            
+            write_archive(backup_path, files, codec, level)
+            if incremental:
+                record_backup(backup_dir, 'all_skills', codec, backup_path, signatures)
+            
+            if verbose:
+                print_archived_files(files)
             print(MSG_BACKUP_ALL_SUCCESS.format(path=backup_path))
+            print(MSG_BACKUP_FILE_COUNT.format(count=len(files)))
             size_mb = backup_path.stat().st_size / 1024 / 1024
             print(MSG_BACKUP_SIZE.format(size=size_mb))
             return backup_path
@@ -141,13 +428,27 @@ def create_backup(skill_name=None, output_dir=None):
             print(f"{RED}Error backing up skills: {e}{RESET}")
             return None
 
+def find_backups():
+    """
+    Find all backup archives in BACKUPS_DIR, newest first.
+    
+    Returns:
+        list of (Path, os.stat_result) tuples, stat'ed once per archive
+    """
+    extensions = tuple(CODEC_EXTENSIONS.values())
+    with os.scandir(BACKUPS_DIR) as entries:
+        backups = [(Path(entry.path), entry.stat()) for entry in entries
+                   if entry.name.endswith(extensions) and entry.is_file()]
+    backups.sort(key=lambda item: item[1].st_mtime, reverse=True)
+    return backups
+
 def list_backups():
     """List all available backups"""
     if not BACKUPS_DIR.exists():
         print(MSG_NO_BACKUPS)
         return
     
-    backups = sorted(BACKUPS_DIR.glob('*.zip'), key=lambda p: p.stat().st_mtime, reverse=True)
+    backups = find_backups()
     
     if not backups:
         print(MSG_NO_BACKUPS)
@@ -157,36 +458,136 @@ def list_backups():
     print(f"{'Filename':<40} {'Size (MB)':<15} {'Date'}")
     print("-" * 80)
     
-    for backup in backups:
-        size_mb = backup.stat().st_size / 1024 / 1024
-        date = datetime.datetime.fromtimestamp(backup.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+    for backup, st in backups:
+        size_mb = st.st_size / 1024 / 1024
+        date = datetime.datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
         print(f"{backup.name:<40} {size_mb:<15.2f} {date}")
     
     print()
 
+def extract_zip_members(zipf, infos):
+    """
+    Extract zip members into SKILLS_DIR, copying each through a 1 MiB buffer.
+    
+    Members whose paths would land outside SKILLS_DIR are skipped.
+    
+    Args:
+        zipf: Open ZipFile to read from
+        infos: ZipInfo entries to extract
+    
+    Returns:
+        int: Number of members extracted
+    """
+    root = SKILLS_DIR.resolve()
+    created_dirs = set()
+    count = 0
+    for info in infos:
+        target = (root / info.filename).resolve()
+        if target != root and root not in target.parents:
+            print(MSG_UNSAFE_BACKUP_PATH.format(path=info.filename))
+            continue
+        
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            if target.parent not in created_dirs:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(target.parent)
+            with zipf.open(info) as src, open(target, 'wb', buffering=WRITE_BUFFER_SIZE) as dst:
+                shutil.copyfileobj(src, dst, WRITE_BUFFER_SIZE)
+        count += 1
+    return count
+
+def is_skill_member(name, skill_name):
+    """Return True if an archive entry belongs to skill_name."""
+    return name.startswith(skill_name + '/') or name == skill_name
+
+def zstd_archive_has_skill(backup_path, skill_name):
+    """
+    Check whether a .tar.zst backup contains any entries for a skill.
+    
+    Args:
+        backup_path: Path to the .tar.zst backup
+        skill_name: Name of the skill to look for
+    
+    Returns:
+        bool: True if at least one member belongs to the skill
+    """
+    import tarfile
+    decompressor = zstandard.ZstdDecompressor()
+    with open(backup_path, 'rb') as f, \
+            decompressor.stream_reader(f) as reader, \
+            tarfile.open(fileobj=reader, mode='r|') as tar:
+        return any(is_skill_member(member.name, skill_name) for member in tar)
+
+def extract_zstd_archive(backup_path, skill_name=None):
+    """
+    Stream-extract a .tar.zst backup into SKILLS_DIR.
+    
+    Args:
+        backup_path: Path to the .tar.zst backup
+        skill_name: Only extract this skill's entries, or None for everything
+    
+    Returns:
+        int: Number of archive members extracted
+    """
+    import tarfile
+    # Reject absolute paths and links escaping SKILLS_DIR where supported
+    extract_kwargs = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+    count = 0
+    decompressor = zstandard.ZstdDecompressor()
+    with open(backup_path, 'rb') as f, \
+            decompressor.stream_reader(f) as reader, \
+            tarfile.open(fileobj=reader, mode='r|') as tar:
+        for member in tar:
+            if skill_name and not is_skill_member(member.name, skill_name):
+                continue
+            tar.extract(member, SKILLS_DIR, **extract_kwargs)
+            count += 1
+    return count
+
 def restore_backup(backup_file, skill_name=None, force=False):
     """
     Restore skills from a backup.
     
     Args:
-        backup_file: Path to backup zip file
+        backup_file: Path to backup .zip or .tar.zst file
         skill_name: Name of specific skill to restore, or None to restore all
         force: Force overwrite without confirmation
     """
+    import zipfile
     backup_path = Path(backup_file)
     
     if not backup_path.exists():
         print(f"{RED}Error: Backup file not found: {backup_path}{RESET}")
         return False
     
+    is_zstd = backup_path.name.endswith(CODEC_EXTENSIONS['zstd'])
+    if is_zstd and zstandard is None:
+        print(MSG_ZSTD_UNAVAILABLE)
+        return False
+    
     print(MSG_RESTORING.format(name=backup_path.name))
     
     try:
-        with zipfile.ZipFile(backup_path, 'r') as zipf:
-            # List contents
-            if skill_name:
-                # Restore single skill
-                skill_path = SKILLS_DIR / skill_name
+        if skill_name:
+            # Restore single skill; the installed copy is cleared the same way
+            # the installer does, and list/cleanup never load the installer
+            from install_skill import remove_in_background
+            skill_path = SKILLS_DIR / skill_name
+            removal = None
+            
+            with contextlib.nullcontext() if is_zstd else zipfile.ZipFile(backup_path, 'r') as zipf:
+                # Make sure the skill is in the backup before touching the installed copy
+                if zipf is None:
+                    found = zstd_archive_has_skill(backup_path, skill_name)
+                else:
+                    skill_files = [info for info in zipf.infolist()
+                                   if is_skill_member(info.filename, skill_name)]
+                    found = bool(skill_files)
+                if not found:
+                    print(MSG_SKILL_NOT_IN_BACKUP.format(name=skill_name))
+                    return False
                 
                 if skill_path.exists():
                     if not force:
@@ -194,28 +595,38 @@ def restore_backup(backup_file, skill_name=None, force=False):
                         if confirm != 'y':
                             print(MSG_RESTORE_CANCELLED)
                             return False
-                    shutil.rmtree(skill_path)
+                    # Old copy is deleted while the backup is being extracted
+                    removal = remove_in_background(skill_path)
                 
                 # Extract skill files
-                skill_files = [f for f in zipf.namelist() if f.startswith(skill_name + '/') or f == skill_name]
-                if not skill_files:
-                    print(f"{RED}Error: Skill '{skill_name}' not found in backup.{RESET}")
+                try:
+                    if zipf is None:
+                        restored = extract_zstd_archive(backup_path, skill_name)
+                    else:
+                        restored = extract_zip_members(zipf, skill_files)
+                finally:
+                    if removal is not None:
+                        removal.join()
+            
+            if not restored:
+                print(MSG_SKILL_NOT_IN_BACKUP.format(name=skill_name))
+                return False
+            
+            print(MSG_RESTORED_SINGLE.format(name=skill_name))
+        else:
+            # Restore all skills
+            if not force:
+                confirm = input(MSG_RESTORE_CONFIRM).lower()
+                if confirm != 'y':
+                    print(MSG_RESTORE_CANCELLED)
                     return False
-                
-                for file in skill_files:
-                    zipf.extract(file, SKILLS_DIR)
-                
-                print(MSG_RESTORED_SINGLE.format(name=skill_name))
+            
+            if is_zstd:
+                extract_zstd_archive(backup_path)
             else:
-                # Restore all skills
-                if not force:
-                    confirm = input(MSG_RESTORE_CONFIRM).lower()
-                    if confirm != 'y':
-                        print(MSG_RESTORE_CANCELLED)
-                        return False
-                
-                zipf.extractall(SKILLS_DIR)
-                print(MSG_RESTORED_ALL)
+                with zipfile.ZipFile(backup_path, 'r') as zipf:
+                    extract_zip_members(zipf, zipf.infolist())
+            print(MSG_RESTORED_ALL)
         
         return True
     except Exception as e:
@@ -227,7 +638,7 @@ def cleanup_old_backups(keep=5):
     if not BACKUPS_DIR.exists():
         return
     
-    backups = sorted(BACKUPS_DIR.glob('*.zip'), key=lambda p: p.stat().st_mtime, reverse=True)
+    backups = find_backups()
     old_backups = backups[keep:]
     
     if not old_backups:
@@ -236,9 +647,9 @@ def cleanup_old_backups(keep=5):
     
     print(MSG_CLEANING_BACKUPS.format(keep=keep))
     
-    for old_backup in old_backups:
+    for old_backup, _ in old_backups:
         try:
-            old_backup.unlink()
+            os.unlink(old_backup)
             print(MSG_REMOVED_BACKUP.format(name=old_backup.name))
         except Exception as e:
             print(f"{RED}Error removing {old_backup.name}: {e}{RESET}")
@@ -253,13 +664,22 @@ def main():
     backup_parser = subparsers.add_parser('backup', help='Create a backup')
     backup_parser.add_argument('--skill', '-s', help='Name of specific skill to backup')
     backup_parser.add_argument('--output', '-o', help='Custom output directory')
+    backup_parser.add_argument('--codec', choices=sorted(CODEC_EXTENSIONS), default='deflate',
+                               help='Compression codec: deflate (.zip, default) or zstd (.tar.zst, requires zstandard)')
+    backup_parser.add_argument('--verbose', '-v', action='store_true',
+                               default=os.environ.get('BACKUP_VERBOSE') == '1',
+                               help='List every archived file (default from BACKUP_VERBOSE=1)')
+    backup_parser.add_argument('--incremental', '-i', action='store_true',
+                               help='Skip the backup if no file changed since the last incremental backup')
+    backup_parser.add_argument('--level', '-l', type=int, choices=range(0, 10), metavar='{0-9}',
+                               help='Compression level, 1 = fastest (default: 1 for deflate, 3 for zstd)')
     
     # List command
     subparsers.add_parser('list', help='List available backups')
     
     # Restore command
     restore_parser = subparsers.add_parser('restore', help='Restore from backup')
-    restore_parser.add_argument('backup_file', help='Path to backup zip file')
+    restore_parser.add_argument('backup_file', help='Path to backup .zip or .tar.zst file')
     restore_parser.add_argument('--skill', '-s', help='Name of specific skill to restore')
     restore_parser.add_argument('--force', '-f', action='store_true', help='Force overwrite without confirmation')
     
@@ -270,7 +690,8 @@ def main():
     args = parser.parse_args()
     
     if args.command == 'backup':
-        create_backup(skill_name=args.skill, output_dir=args.output)
+        create_backup(skill_name=args.skill, output_dir=args.output, codec=args.codec, verbose=args.verbose,
+                      level=args.level, incremental=args.incremental)
     elif args.command == 'list':
         list_backups()
     elif args.command == 'restore':
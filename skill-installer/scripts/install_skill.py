@@ -6,16 +6,23 @@ Supports GitHub URLs and subdirectories (e.g., vercel-labs/agent-skills/skill-na
 
 import sys
 import os
-import argparse
 import subprocess
 import shutil
-import tempfile
 import time
 import json
 import datetime
 import re
-import yaml
+import functools
+import contextlib
+import itertools
+import threading
 from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from messages import *
 except ImportError:
@@ -32,14 +39,63 @@ except ImportError:
         MSG_COMMAND_FAILED = f"{RED}Command failed: {{error}}{RESET}"
         MSG_STDERR = f"Stderr: {{stderr}}"
 
-def run_command(cmd, cwd=None, capture_output=False):
+SKILLS_DIR = Path(__file__).parent.parent.parent
+AUDIT_SCRIPT = SKILLS_DIR / 'skill-auditor' / 'scripts' / 'audit_skill.py'
+# Base URL for short user/repo sources, read once so parse_source can be cached
+GITHUB_BASE = os.environ.get("GITHUB_URL", "https://github.com").rstrip("/")
+
+# https://github.com/<user>/<repo>[.git][/tree/...] -> (user, repo)
+GITHUB_URL_RE = re.compile(r'^https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?(?:/tree/.*)?$')
+
+# Update checks ask only for HEAD over protocol v2 (no full ref advertisement)
+# and never stop to prompt for credentials (terminal or Git Credential Manager UI)
+LS_REMOTE_CMD = ['git', '-c', 'protocol.version=2', 'ls-remote']
+LS_REMOTE_ENV = dict(os.environ, GIT_TERMINAL_PROMPT='0', GCM_INTERACTIVE='Never')
+# Remote HEADs seen by recent update checks (manage_skills.py check and
+# update_all_skills.py), as {url: [hash, unix_time]}; entries younger than
+# REMOTE_CACHE_TTL seconds are reused instead of asking git again
+REMOTE_CACHE_FILE = SKILLS_DIR / '.skills_ls_remote_cache.json'
+REMOTE_CACHE_TTL = 300
+
+# Monorepo directories probed for a subdirectory that is not at the given path
+FALLBACK_PREFIXES = ('packages', 'apps')
+# Leading bytes of SKILL.md read for its frontmatter before falling back to
+# the whole file
+FRONTMATTER_READ_SIZE = 16 * 1024
+# Candidate keyword words in a skill description
+_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+# Absolute git path, resolved once. With an absolute executable, no cwd and
+# close_fds=False, subprocess can launch through os.posix_spawn on POSIX
+# instead of fork/exec (our fds are non-inheritable by default anyway)
+GIT_EXECUTABLE = shutil.which('git')
+
+def spawn_args(cmd, cwd):
+    """
+    Rewrite a git command so subprocess can use its posix_spawn fast path.
+
+    Args:
+        cmd: Command argument list
+        cwd: Working directory for the command, or None
+
+    Returns:
+        (cmd, cwd, close_fds) to pass to subprocess.run
+    """
+    if os.name != 'posix' or not GIT_EXECUTABLE or not cmd or cmd[0] != 'git':
+        return cmd, cwd, True
+    if cwd is None:
+        return [GIT_EXECUTABLE] + cmd[1:], None, False
+    return [GIT_EXECUTABLE, '-C', str(cwd)] + cmd[1:], None, False
+
+def run_command(cmd, cwd=None, capture_output=False, env=None):
     """Run a shell command and check for errors"""
+    cmd, cwd, close_fds = spawn_args(cmd, cwd)
     try:
         if capture_output:
-            result = subprocess.run(cmd, check=True, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors='replace')
+            result = subprocess.run(cmd, check=True, cwd=cwd, env=env, close_fds=close_fds, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors='replace')
             return result.stdout.strip()
         else:
-            subprocess.run(cmd, check=True, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            subprocess.run(cmd, check=True, cwd=cwd, env=env, close_fds=close_fds, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             return True
     except subprocess.CalledProcessError as e:
         if not capture_output:
@@ -48,17 +104,138 @@ def run_command(cmd, cwd=None, capture_output=False):
             print(MSG_STDERR.format(stderr=stderr))
         return False
 
+# Parsed skills.json / skill_map.json keyed by path, tagged with the mtime
+# they were read or written at, so repeated installs in one process (e.g.
+# update-all) skip re-reading and re-parsing them
+_json_cache = {}
+# Serializes read-modify-write cycles of both files across installer threads
+REGISTRY_LOCK = threading.Lock()
+# json.dump() issues many small writes; let them collect in a larger buffer
+JSON_WRITE_BUFFER_SIZE = 1 << 16
+
+def sync_file(f):
+    """Flush a file's buffers and fsync it so its contents survive a crash."""
+    f.flush()
+    os.fsync(f.fileno())
+
+def load_json_cached(path):
+    """
+    Load a JSON file, reusing the parsed copy while its mtime is unchanged.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The parsed data, or None if the file does not exist
+
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _json_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    content = path.read_bytes()
+    data = orjson.loads(content) if orjson is not None else json.loads(content)
+    _json_cache[path] = (mtime_ns, data)
+    return data
+
+def write_json_cached(path, data):
+    """
+    Write a JSON file and remember it as the cached copy for load_json_cached.
+
+    The data is written to a sibling .tmp file, flushed to disk and renamed
+    over the target, so neither readers nor a crash can leave a half-written
+    file. orjson is used when installed; otherwise the stdlib encoder streams
+    the file. Both write raw UTF-8 (no \\u escapes), so the bytes on disk do
+    not depend on whether orjson is available.
+
+    Args:
+        path: Path to the JSON file
+        data: Data to serialize
+    """
+    _json_cache.pop(path, None)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                sync_file(f)
+        else:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=JSON_WRITE_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                sync_file(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    _json_cache[path] = (path.stat().st_mtime_ns, data)
+
+def ls_remote_head(url):
+    """Return the remote HEAD hash of a repository, or None if it cannot be queried"""
+    remote_head = run_command(LS_REMOTE_CMD + [url, 'HEAD'], capture_output=True, env=LS_REMOTE_ENV)
+    return remote_head.split()[0] if remote_head else None
+
+def load_remote_cache():
+    """Load the ls-remote result cache, or an empty one if missing or unreadable"""
+    try:
+        cache = load_json_cached(REMOTE_CACHE_FILE)
+    except Exception:
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def fresh_remote_heads(cache, urls, now):
+    """
+    Look up repositories checked within the last REMOTE_CACHE_TTL seconds.
+
+    Args:
+        cache: Cache loaded by load_remote_cache
+        urls: Repository URLs to look up
+        now: Current unix time
+
+    Returns:
+        dict mapping each URL with a fresh entry to its cached HEAD hash
+    """
+    heads = {}
+    for url in urls:
+        entry = cache.get(url)
+        if entry and now - entry[1] < REMOTE_CACHE_TTL:
+            heads[url] = entry[0]
+    return heads
+
+def save_remote_heads(cache, fetched, now):
+    """
+    Record successful ls-remote results in the cache file.
+
+    Args:
+        cache: Cache loaded by load_remote_cache; updated in place
+        fetched: dict mapping URL to HEAD hash (None for failed lookups)
+        now: Unix time the lookups were made at
+    """
+    fresh = {url: [remote_hash, now] for url, remote_hash in fetched.items() if remote_hash}
+    if not fresh:
+        return
+    cache.update(fresh)
+    try:
+        write_json_cached(REMOTE_CACHE_FILE, cache)
+    except OSError:
+        pass  # The cache is only an optimization
+
 def update_registry(dest_root, skill_name, repo_url, subdir, commit_hash):
     """Update the skills.json registry file"""
     registry_path = dest_root / 'skills.json'
     registry = {'skills': {}}
     
-    if registry_path.exists():
-        try:
-            content = registry_path.read_text(encoding='utf-8')
-            registry = json.loads(content)
-        except Exception as e:
-            print(MSG_REGISTRY_READ_ERROR.format(error=e))
+    try:
+        registry = load_json_cached(registry_path) or registry
+    except Exception as e:
+        print(MSG_REGISTRY_READ_ERROR.format(error=e))
 
     registry['skills'][skill_name] = {
         'source': repo_url,
@@ -68,22 +245,62 @@ def update_registry(dest_root, skill_name, repo_url, subdir, commit_hash):
     }
     
     try:
-        registry_path.write_text(json.dumps(registry, indent=2), encoding='utf-8')
+        write_json_cached(registry_path, registry)
         print(MSG_REGISTRY_UPDATED.format(path=registry_path))
     except Exception as e:
         print(MSG_REGISTRY_WRITE_ERROR.format(error=e))
 
+def extract_frontmatter(content):
+    """
+    Slice the YAML frontmatter out of a SKILL.md document.
+
+    Only the text up to the closing '---' is looked at; the markdown body
+    after it is never scanned.
+
+    Args:
+        content: SKILL.md text
+
+    Returns:
+        The frontmatter text between the '---' lines, or None if there is none
+    """
+    if not content.startswith('---\n'):
+        return None
+    end = content.find('\n---', 4)
+    if end == -1:
+        return None
+    return content[4:end]
+
+def read_frontmatter(skill_md):
+    """
+    Read the frontmatter of a SKILL.md file without loading its whole body.
+
+    Args:
+        skill_md: Path to SKILL.md
+
+    Returns:
+        The frontmatter text, or None if the file has none
+    """
+    with open(skill_md, 'rb') as f:
+        head = f.read(FRONTMATTER_READ_SIZE)
+        # No opening fence: nothing to decode, and never read past the prefix
+        if not head.startswith(b'---\n'):
+            return None
+        frontmatter_text = extract_frontmatter(head.decode('utf-8', errors='replace'))
+        if frontmatter_text is None and len(head) == FRONTMATTER_READ_SIZE:
+            # Frontmatter longer than the prefix: read the rest as well
+            content = (head + f.read()).decode('utf-8', errors='replace')
+            frontmatter_text = extract_frontmatter(content)
+    return frontmatter_text
+
 def update_skill_map(dest_root, skill_name, skill_path):
     """Update the skill_map.json file with skill metadata"""
     skill_map_path = dest_root / 'skill_map.json'
     skill_map = {'skills': {}, 'detection_rules': {'priority_order': [], 'exact_match': {}, 'partial_match': {}}}
     
-    if skill_map_path.exists():
-        try:
-            content = skill_map_path.read_text(encoding='utf-8')
-            skill_map = json.loads(content)
-        except Exception as e:
-            print(f"Warning: Could not read skill_map.json: {e}")
+    try:
+        skill_map = load_json_cached(skill_map_path) or skill_map
+    except Exception as e:
+        print(f"Warning: Could not read skill_map.json: {e}")
     
     # Extract metadata from SKILL.md
     skill_md = skill_path / 'SKILL.md'
@@ -93,10 +310,12 @@ def update_skill_map(dest_root, skill_name, skill_path):
     
     if skill_md.exists():
         try:
-            content = skill_md.read_text(encoding='utf-8')
-            match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-            if match:
-                frontmatter = yaml.safe_load(match.group(1))
+            frontmatter_text = read_frontmatter(skill_md)
+            if frontmatter_text is not None:
+                import yaml
+                # libyaml's C loader when PyYAML was built with it
+                loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                frontmatter = yaml.load(frontmatter_text, Loader=loader)
                 description = frontmatter.get('description', '')
                 keywords = frontmatter.get('keywords', [])
                 aliases = frontmatter.get('aliases', [])
@@ -107,9 +326,11 @@ def update_skill_map(dest_root, skill_name, skill_path):
     if not keywords:
         keywords = [skill_name.replace('-', ' ')]
         if description:
-            words = re.findall(r'\b[a-zA-Z]{4,}\b', description.lower())
-            keywords.extend(words[:5])
-        keywords = list(set(keywords))
+            # Stop scanning after the first five words instead of matching them all
+            words = itertools.islice(_WORD_RE.finditer(description.lower()), 5)
+            keywords.extend(match.group(0) for match in words)
+        # Drop duplicates, keeping first-seen order so the output is stable
+        keywords = list(dict.fromkeys(keywords))
         print(f"Auto-generated keywords for '{skill_name}': {keywords}")
     
     # Auto-generate aliases if not provided
@@ -124,33 +345,39 @@ def update_skill_map(dest_root, skill_name, skill_path):
         'aliases': aliases
     }
     
+    detection_rules = skill_map['detection_rules']
+    
     # Add to priority_order if not already present
-    if skill_name not in skill_map['detection_rules']['priority_order']:
-        skill_map['detection_rules']['priority_order'].append(skill_name)
+    priority_order = detection_rules['priority_order']
+    if skill_name not in priority_order:
+        priority_order.append(skill_name)
     
     # Add exact matches based on skill name
     skill_name_lower = skill_name.lower().replace('-', ' ')
-    skill_map['detection_rules']['exact_match'][skill_name_lower] = skill_name
+    detection_rules['exact_match'][skill_name_lower] = skill_name
     
     # Add partial matches based on keywords
+    partial_match = detection_rules['partial_match']
     for keyword in keywords:
         keyword_lower = keyword.lower()
-        if keyword_lower not in skill_map['detection_rules']['partial_match']:
-            skill_map['detection_rules']['partial_match'][keyword_lower] = skill_name
-        elif isinstance(skill_map['detection_rules']['partial_match'][keyword_lower], str):
-            # Convert to list if multiple skills match
-            existing = skill_map['detection_rules']['partial_match'][keyword_lower]
-            skill_map['detection_rules']['partial_match'][keyword_lower] = [existing, skill_name]
-        elif isinstance(skill_map['detection_rules']['partial_match'][keyword_lower], list):
-            if skill_name not in skill_map['detection_rules']['partial_match'][keyword_lower]:
-                skill_map['detection_rules']['partial_match'][keyword_lower].append(skill_name)
+        existing = partial_match.get(keyword_lower)
+        if existing is None:
+            partial_match[keyword_lower] = skill_name
+        elif isinstance(existing, str):
+            # Convert to list if multiple skills match (not on reinstall)
+            if existing != skill_name:
+                partial_match[keyword_lower] = [existing, skill_name]
+        elif isinstance(existing, list):
+            if skill_name not in existing:
+                existing.append(skill_name)
     
     try:
-        skill_map_path.write_text(json.dumps(skill_map, indent=2, ensure_ascii=False), encoding='utf-8')
+        write_json_cached(skill_map_path, skill_map)
         print(f"Updated skill_map.json with '{skill_name}'")
     except Exception as e:
         print(f"Warning: Could not update skill_map.json: {e}")
 
+@functools.lru_cache(maxsize=128)
 def parse_source(source):
     """
     Parse the source string into repo_url and subdir.
@@ -172,15 +399,214 @@ def parse_source(source):
     # Short format: user/repo or user/repo/subdir
     parts = source.split('/')
     if len(parts) >= 2:
-        github_base = os.environ.get("GITHUB_URL", "https://github.com").rstrip("/")
-        repo_url = f"{github_base}/{parts[0]}/{parts[1]}.git"
+        repo_url = f"{GITHUB_BASE}/{parts[0]}/{parts[1]}.git"
         if len(parts) > 2:
             subdir = "/".join(parts[2:])
         return repo_url, subdir
         
     return source, ""
 
-def install_skill(source, dest_root, run_audit=True, force=False):
+def build_install_source(repo_url, subdir):
+    """
+    Build the install_skill source string that reinstalls a registry entry.
+    
+    Args:
+        repo_url: Repository URL recorded in skills.json
+        subdir: Subdirectory recorded in skills.json
+    
+    Returns:
+        str: Source string for install_skill / parse_source
+    """
+    # Construct install source string
+    # Simplified logic: Use the stored repo_url directly, or combine with subdir if needed.
+    # install_skill.py handles full URLs and GITHUB_URL env var correctly.
+    
+    install_source = repo_url
+    
+    # If we have a subdir and the URL doesn't already point to it (simplistic check)
+    # Actually, install_skill expects "url" and "subdir" separately logic OR "url/subdir" string
+    # But parse_source in install_skill splits by space or tries to guess.
+    # Best way is to reconstruct the "user/repo/subdir" format IF it was a github URL,
+    # OR just pass the full URL and let install_skill handle it?
+    # install_skill(source, ...) calls parse_source(source).
+    
+    # Let's try to be smart but robust.
+    # If it's a standard GitHub URL, we can rely on install_skill's env var logic if we pass the full URL.
+    # But install_skill's parse_source logic for full URLs is:
+    # if source.startswith("https://"): return source, ""
+    # Unless it has /tree/main/
+    
+    # So if we have a subdir, we MUST provide it in a way parse_source understands.
+    # Option A: "https://github.com/user/repo/tree/main/subdir"
+    # Option B: "user/repo/subdir"
+    
+    if subdir:
+        match = GITHUB_URL_RE.match(repo_url)
+        if match:
+            # Short form resolves through GITHUB_URL, so a mirror set at update time is used
+            install_source = f"{match.group(1)}/{match.group(2)}/{subdir}"
+        elif "github.com" in repo_url and "/tree/" not in repo_url:
+            # e.g. git@github.com:user/repo.git; parse_source splits on /tree/main/
+            base_url = repo_url[:-4] if repo_url.endswith(".git") else repo_url
+            install_source = f"{base_url}/tree/main/{subdir}"
+    return install_source
+
+def subdir_candidates(subdir):
+    """
+    List the repository paths install_skill probes for a subdirectory.
+    
+    Args:
+        subdir: Subdirectory requested in the install source
+    
+    Returns:
+        list of relative paths, in probe order
+    """
+    leaf = subdir.rsplit('/', 1)[-1]
+    return [f"skills/{leaf}", subdir] + [f"{prefix}/{leaf}" for prefix in FALLBACK_PREFIXES]
+
+def sparse_checkout(temp_path, subdir):
+    """
+    Check out only the candidate subdirectories of a --no-checkout clone.
+    
+    Falls back to a full checkout if sparse-checkout is unavailable
+    (git older than 2.25).
+    
+    Args:
+        temp_path: Path of the cloned repository
+        subdir: Subdirectory requested in the install source
+    
+    Returns:
+        bool: True if the working tree was checked out
+    """
+    if run_command(['git', 'sparse-checkout', 'init', '--cone'], cwd=temp_path) and \
+            run_command(['git', 'sparse-checkout', 'set'] + subdir_candidates(subdir), cwd=temp_path):
+        return bool(run_command(['git', 'checkout'], cwd=temp_path))
+    run_command(['git', 'sparse-checkout', 'disable'], cwd=temp_path)
+    return bool(run_command(['git', 'checkout'], cwd=temp_path))
+
+def fast_copytree(src, dst):
+    """
+    Copy a freshly cloned tree into a new destination directory.
+    
+    Walks the source with os.scandir on plain strings and copies each file
+    with shutil.copyfile, which uses in-kernel copies (sendfile on Linux,
+    fcopyfile on macOS). Only permission bits are carried over, not
+    timestamps, since a fresh checkout has no meaningful mtimes.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+    """
+    os.makedirs(dst)
+    stack = [(os.fspath(src), os.fspath(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    os.mkdir(target)
+                    stack.append((entry.path, target))
+                else:
+                    shutil.copyfile(entry.path, target)
+                    shutil.copymode(entry.path, target)
+
+def contains_symlinks(root):
+    """
+    Check whether a directory tree contains any symbolic links.
+    
+    Args:
+        root: Directory to walk (links below it are not followed)
+    
+    Returns:
+        bool: True at the first symlink found
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    return True
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return False
+
+def remove_in_background(path):
+    """
+    Move a directory out of the way and delete it on a background thread.
+    
+    The rename is atomic, so the original path is free immediately and a crash
+    never leaves a half-deleted skill in place. If the rename fails, the tree
+    is removed synchronously instead. The trash name is dot-prefixed so skill
+    scans skip it while it is being deleted.
+    
+    Args:
+        path: Path of the directory to remove
+    
+    Returns:
+        threading.Thread doing the removal, or None if it was removed synchronously
+    """
+    trash = path.with_name(f".{path.name}.trash.{os.getpid()}")
+    try:
+        path.rename(trash)
+    except OSError:
+        shutil.rmtree(path)
+        return None
+    
+    thread = threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True})
+    thread.start()
+    return thread
+
+def clone_repository(repo_url, temp_path, subdir=""):
+    """
+    Shallow-clone a repository into an empty directory, retrying on failure.
+    
+    Args:
+        repo_url: URL of the repository to clone
+        temp_path: Empty directory to clone into
+        subdir: If given, only the candidate paths for this subdirectory are
+            checked out (blobs of other paths are never fetched)
+    
+    Returns:
+        bool: True if the clone (and checkout) succeeded
+    """
+    print(MSG_CLONING)
+    # For subdirectory installs, fetch only the blobs of the probed paths
+    if subdir:
+        clone_cmd = ['git', 'clone', '--depth', '1', '--filter=blob:none', '--no-checkout', repo_url, '.']
+    else:
+        clone_cmd = ['git', 'clone', '--depth', '1', repo_url, '.']
+    max_retries = 3
+    for attempt in range(max_retries):
+        if run_command(clone_cmd, cwd=temp_path):
+            break
+        print(MSG_RETRY.format(attempt=attempt + 1, max_retries=max_retries))
+        time.sleep(2 ** attempt)
+    else:
+        print(MSG_CLONE_FAILED.format(max_retries=max_retries))
+        return False
+    
+    if subdir and not sparse_checkout(temp_path, subdir):
+        print(MSG_CLONE_FAILED.format(max_retries=max_retries))
+        return False
+    return True
+
+def install_skill(source, dest_root, run_audit=True, force=False, checkout=None):
+    """
+    Install a skill from a git repository into dest_root.
+    
+    Args:
+        source: Git URL or 'user/repo/subdir' string
+        dest_root: Directory the skill is installed into
+        run_audit: Run skill-auditor on the installed skill
+        force: Overwrite an existing skill without prompting
+        checkout: Existing full clone of the source repository, used in
+            place of a fresh clone (shared by several skills of one repo);
+            the skill is copied out of it and it is left in place
+    
+    Returns:
+        bool: True if the skill was installed
+    """
     dest_root = Path(dest_root)
     repo_url, subdir = parse_source(source)
     
@@ -189,19 +615,18 @@ def install_skill(source, dest_root, run_audit=True, force=False):
         print(MSG_SUBDIR.format(subdir=subdir))
     print(MSG_DESTINATION.format(path=dest_root))
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    if checkout is None:
+        import tempfile
+        # A plain mkdtemp rather than TemporaryDirectory: the clone (or part of it)
+        # may be renamed into place below, leaving nothing at the original path
+        temp_dir = tempfile.mkdtemp()
+    else:
+        temp_dir = None
+    removal = None
+    try:
+        temp_path = Path(temp_dir) if checkout is None else Path(checkout)
         
-        # Clone repo
-        print(MSG_CLONING)
-        max_retries = 3
-        for attempt in range(max_retries):
-            if run_command(['git', 'clone', '--depth', '1', repo_url, '.'], cwd=temp_path):
-                break
-            print(MSG_RETRY.format(attempt=attempt + 1, max_retries=max_retries))
-            time.sleep(2 ** attempt)
-        else:
-            print(MSG_CLONE_FAILED.format(max_retries=max_retries))
+        if checkout is None and not clone_repository(repo_url, temp_path, subdir):
             return False
             
         # Get commit hash
@@ -213,26 +638,30 @@ def install_skill(source, dest_root, run_audit=True, force=False):
         # Determine source path
         source_path = temp_path
         if subdir:
+            leaf = subdir.rsplit('/', 1)[-1]
+            # One listing of the checkout root; prefixes missing from it are
+            # never stat'ed
+            with os.scandir(temp_path) as entries:
+                top_dirs = {entry.name for entry in entries if entry.is_dir()}
             # Try skills/ prefix first (common pattern for monorepos)
-            skills_path = temp_path / 'skills' / subdir.split('/')[-1]
-            if skills_path.exists():
-                print(MSG_SUBDIR_FOUND_ALT.format(subdir=subdir, alt_path=f"skills/{subdir.split('/')[-1]}"))
+            skills_path = temp_path / 'skills' / leaf
+            if 'skills' in top_dirs and skills_path.exists():
+                print(MSG_SUBDIR_FOUND_ALT.format(subdir=subdir, alt_path=f"skills/{leaf}"))
                 source_path = skills_path
-                subdir = f"skills/{subdir.split('/')[-1]}"
+                subdir = f"skills/{leaf}"
             else:
                 # Try exact path
                 source_path = temp_path / subdir
             
             if not source_path.exists():
                 # Try other common prefixes if still not found
-                common_prefixes = ['packages', 'apps']
                 found = False
-                for prefix in common_prefixes:
-                    alt_path = temp_path / prefix / subdir.split('/')[-1]
-                    if alt_path.exists():
-                        print(MSG_SUBDIR_FOUND_ALT.format(subdir=subdir, alt_path=f"{prefix}/{subdir.split('/')[-1]}"))
+                for prefix in FALLBACK_PREFIXES:
+                    alt_path = temp_path / prefix / leaf
+                    if prefix in top_dirs and alt_path.exists():
+                        print(MSG_SUBDIR_FOUND_ALT.format(subdir=subdir, alt_path=f"{prefix}/{leaf}"))
                         source_path = alt_path
-                        subdir = f"{prefix}/{subdir.split('/')[-1]}"
+                        subdir = f"{prefix}/{leaf}"
                         found = True
                         break
                 
@@ -245,7 +674,7 @@ def install_skill(source, dest_root, run_audit=True, force=False):
             skill_name = Path(subdir).name
         else:
             # Extract from repo URL: https://github.com/user/repo.git -> repo
-            skill_name = repo_url.rstrip('/').split('/')[-1]
+            skill_name = repo_url.rstrip('/').rsplit('/', 1)[-1]
             if skill_name.endswith('.git'):
                 skill_name = skill_name[:-4]
 
@@ -255,27 +684,44 @@ def install_skill(source, dest_root, run_audit=True, force=False):
             print(MSG_DEST_EXISTS.format(path=dest_path))
             if force:
                 print(MSG_FORCE_OVERWRITE)
-                shutil.rmtree(dest_path)
             else:
                 overwrite = input(MSG_OVERWRITE_PROMPT).lower()
                 if overwrite != 'y':
                     print(MSG_INSTALL_ABORTED)
                     return False
-                shutil.rmtree(dest_path)
+            # The old copy is deleted while the new one is moved in and audited
+            removal = remove_in_background(dest_path)
             
-        # Move files
-        shutil.copytree(source_path, dest_path)
+        # Move files: renaming is a metadata-only operation; fall back to a
+        # copy when the temp dir is on another filesystem (EXDEV) or the
+        # rename fails for any other reason
+        dest_root.mkdir(parents=True, exist_ok=True)
+        if checkout is not None:
+            # The shared checkout must stay intact for the other skills
+            fast_copytree(source_path, dest_path)
+        elif contains_symlinks(source_path):
+            # A rename would keep the links themselves; relative links into
+            # the rest of the clone would dangle once it is deleted. The copy
+            # installs the content behind each link instead.
+            fast_copytree(source_path, dest_path)
+        else:
+            try:
+                os.rename(source_path, dest_path)
+            except OSError:
+                fast_copytree(source_path, dest_path)
         print(MSG_INSTALLED_SUCCESS.format(name=skill_name, path=dest_path))
         
-        # Update Registry
-        update_registry(dest_root, skill_name, repo_url, subdir, commit_hash)
-        
-        # Update Skill Map
-        update_skill_map(dest_root, skill_name, dest_path)
+        # Registry and skill map are shared by concurrent installs (update-all)
+        with REGISTRY_LOCK:
+            # Update Registry
+            update_registry(dest_root, skill_name, repo_url, subdir, commit_hash)
+            
+            # Update Skill Map
+            update_skill_map(dest_root, skill_name, dest_path)
 
         # Run Audit
         if run_audit:
-            audit_script = Path(__file__).parent.parent.parent / 'skill-auditor' / 'scripts' / 'audit_skill.py'
+            audit_script = AUDIT_SCRIPT
             if audit_script.exists():
                 print(MSG_AUDIT_RUNNING)
                 try:
@@ -284,10 +730,17 @@ def install_skill(source, dest_root, run_audit=True, force=False):
                     print(MSG_AUDIT_FAILED.format(error=e))
             else:
                 print(MSG_AUDIT_SKIPPED)
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        if removal is not None:
+            removal.join()
                 
     return True
 
 if __name__ == "__main__":
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Install Trae skills from git repositories")
     parser.add_argument("source", help="Git URL or 'user/repo/subdir' string")
     parser.add_argument("--path", default=".trae/skills", help="Destination directory (default: .trae/skills)")
@@ -7,17 +7,19 @@ Supports listing, checking for updates, and updating skills.
 import sys
 import os
 import argparse
-import json
-import subprocess
 import tempfile
 from pathlib import Path
 
 # Import install_skill to reuse installation logic
 # Assuming manage_skills.py is in the same directory as install_skill.py
-current_dir = Path(__file__).parent
-sys.path.append(str(current_dir))
+current_dir = str(Path(__file__).parent)
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
 try:
-    from install_skill import install_skill, run_command
+    from install_skill import (install_skill, run_command, load_json_cached, write_json_cached,
+                               parse_source, clone_repository, build_install_source,
+                               REMOTE_CACHE_TTL, ls_remote_head,
+                               load_remote_cache, fresh_remote_heads, save_remote_heads)
 except ImportError:
     print("Error: Could not import install_skill.py. Make sure it is in the same directory.")
     sys.exit(1)
@@ -43,29 +45,12 @@ except ImportError:
 SKILLS_DIR = Path(__file__).parent.parent.parent
 REGISTRY_FILE = SKILLS_DIR / 'skills.json'
 
-def run_command(cmd, cwd=None, capture_output=False):
-    """Run a shell command and check for errors"""
-    try:
-        if capture_output:
-            # Removed errors='replace' to avoid TypeError in older python versions if check is strict, 
-            # but usually run_command in manage_skills was copy-pasted. 
-            # Assuming standard subprocess usage.
-            result = subprocess.run(cmd, check=True, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors='replace')
-            return result.stdout.strip()
-        else:
-            subprocess.run(cmd, check=True, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return True
-    except subprocess.CalledProcessError as e:
-        if not capture_output:
-            print(MSG_COMMAND_FAILED.format(error=e))
-        return False
-
 def load_registry():
-    if not REGISTRY_FILE.exists():
-        return {}
+    # Shares install_skill's mtime-keyed cache, so update-all re-reads
+    # skills.json only when an install has actually rewritten it
     try:
-        content = REGISTRY_FILE.read_text(encoding='utf-8')
-        return json.loads(content).get('skills', {})
+        registry = load_json_cached(REGISTRY_FILE)
+        return registry.get('skills', {}) if registry else {}
     except Exception as e:
         print(f"{RED}Error reading skills.json: {e}{RESET}")
         return {}
@@ -76,16 +61,50 @@ def list_skills():
         print(MSG_NO_SKILLS_REGISTRY)
         return
 
-    print(MSG_INSTALLED_HEADER)
-    print(f"{'Name':<25} {'Version':<10} {'Source'}")
-    print("-" * 60)
+    # Build the whole table first and emit it with a single write
+    lines = [MSG_INSTALLED_HEADER, f"{'Name':<25} {'Version':<10} {'Source'}", "-" * 60]
     for name, info in skills.items():
         version = info.get('version', 'unknown')[:7]
         source = info.get('source', 'unknown')
-        print(f"{name:<25} {version:<10} {source}")
-    print()
+        lines.append(f"{name:<25} {version:<10} {source}")
+    lines.append("")
+    print('\n'.join(lines))
+
+def resolve_remote_heads(urls, use_cache=True):
+    """
+    Look up the remote HEAD commit of each distinct repository concurrently.
+    
+    Skills installed from the same monorepo share one `git ls-remote` call,
+    and repositories checked within the last REMOTE_CACHE_TTL seconds are
+    answered from REMOTE_CACHE_FILE without touching the network.
+    
+    Args:
+        urls: Repository URLs, possibly repeated
+        use_cache: Whether fresh cache entries may be used (results are
+            written back to the cache either way)
+    
+    Returns:
+        dict mapping each URL to its HEAD hash, or None if the lookup failed
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    
+    now = time.time()
+    cache = load_remote_cache()
+    heads = fresh_remote_heads(cache, unique_urls, now) if use_cache else {}
+    
+    to_fetch = [url for url in unique_urls if url not in heads]
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=min(16, len(to_fetch))) as pool:
+            fetched = dict(zip(to_fetch, pool.map(ls_remote_head, to_fetch)))
+        heads.update(fetched)
+        save_remote_heads(cache, fetched, now)
+    return heads
 
-def check_updates():
+def check_updates(use_cache=True):
     skills = load_registry()
     if not skills:
         print(MSG_NO_SKILLS_REGISTRY)
@@ -94,28 +113,35 @@ def check_updates():
     print(MSG_CHECKING_UPDATES)
     updates_available = []
     
+    # Handle GITHUB_URL override for checks
+    github_base = os.environ.get("GITHUB_URL", "").rstrip("/")
+    to_check = {}
     for name, info in skills.items():
         repo_url = info.get('source')
         current_version = info.get('version')
         
         if not repo_url or not current_version or current_version == 'unknown':
-            print(MSG_SKIPPING_SKILL.format(name=name))
             continue
 
-        # Handle GITHUB_URL override for checks
         check_url = repo_url
-        if "github.com" in repo_url:
-            github_base = os.environ.get("GITHUB_URL", "").rstrip("/")
-            if github_base and "github.com" not in github_base:
-                # Replace https://github.com with mirror base
-                check_url = repo_url.replace("https://github.com", github_base)
-
+        if "github.com" in repo_url and github_base and "github.com" not in github_base:
+            # Replace https://github.com with mirror base
+            check_url = repo_url.replace("https://github.com", github_base)
+        to_check[name] = check_url
+    
+    # Check remote HEADs up front, one git ls-remote per distinct repository
+    remote_heads = resolve_remote_heads(to_check.values(), use_cache=use_cache)
+    
+    for name, info in skills.items():
+        if name not in to_check:
+            print(MSG_SKIPPING_SKILL.format(name=name))
+            continue
+        
+        current_version = info.get('version')
         print(MSG_CHECKING_SKILL.format(name=name), end='', flush=True)
         
-        # Check remote HEAD using git ls-remote
-        remote_head = run_command(['git', 'ls-remote', check_url, 'HEAD'], capture_output=True)
-        if remote_head:
-            remote_hash = remote_head.split()[0]
+        remote_hash = remote_heads.get(to_check[name])
+        if remote_hash:
             if remote_hash != current_version:
                 print(MSG_UPDATE_AVAILABLE.format(current=current_version[:7], remote=remote_hash[:7]))
                 updates_available.append(name)
@@ -157,7 +183,7 @@ def safe_rmtree(path, retries=5, delay=0.5):
             return False
     return False
 
-def update_skill(name, force=False):
+def update_skill(name, force=False, checkout=None):
     skills = load_registry()
     if name not in skills:
         print(MSG_SKILL_NOT_FOUND.format(name=name))
@@ -171,63 +197,7 @@ def update_skill(name, force=False):
         print(MSG_SKILL_LOCAL.format(name=name))
         return
     
-    # Construct install source string
-    # Simplified logic: Use the stored repo_url directly, or combine with subdir if needed.
-    # install_skill.py handles full URLs and GITHUB_URL env var correctly.
-    
-    install_source = repo_url
-    
-    # If we have a subdir and the URL doesn't already point to it (simplistic check)
-    # Actually, install_skill expects "url" and "subdir" separately logic OR "url/subdir" string
-    # But parse_source in install_skill splits by space or tries to guess.
-    # Best way is to reconstruct the "user/repo/subdir" format IF it was a github URL,
-    # OR just pass the full URL and let install_skill handle it?
-    # install_skill(source, ...) calls parse_source(source).
-    
-    # Let's try to be smart but robust.
-    # If it's a standard GitHub URL, we can rely on install_skill's env var logic if we pass the full URL.
-    # But install_skill's parse_source logic for full URLs is:
-    # if source.startswith("https://"): return source, ""
-    # Unless it has /tree/main/
-    
-    # So if we have a subdir, we MUST provide it in a way parse_source understands.
-    # Option A: "https://github.com/user/repo/tree/main/subdir"
-    # Option B: "user/repo/subdir"
-    
-    if subdir:
-        if "github.com" in repo_url and not "tree" in repo_url:
-             # Try to construct tree URL which install_skill parses correctly
-             if repo_url.endswith(".git"):
-                 install_source = f"{repo_url[:-4]}/tree/main/{subdir}"
-             else:
-                 install_source = f"{repo_url}/tree/main/{subdir}"
-        else:
-             # Fallback for non-github or already complex URLs
-             # This might fail if install_skill doesn't support "URL/subdir" pattern for custom git
-             # But install_skill only supports subdir for:
-             # 1. /tree/main/ (GitHub specific)
-             # 2. user/repo/subdir (GitHub specific short form)
-             
-             # If we are using a mirror, the short form "user/repo" logic in install_skill 
-             # uses GITHUB_URL env var. So converting back to short form is actually SAFEST
-             # if we want to respect the env var dynamically!
-             
-             if "github.com" in repo_url:
-                 # Extract user/repo
-                 # https://github.com/user/repo.git -> user/repo
-                 try:
-                     parts = repo_url.rstrip('/').split('/')
-                     if parts[-1].endswith('.git'):
-                         repo_name = parts[-1][:-4]
-                     else:
-                         repo_name = parts[-1]
-                     user_name = parts[-2]
-                     install_source = f"{user_name}/{repo_name}/{subdir}"
-                 except:
-                     # Fallback
-                     install_source = f"{repo_url} --subdir {subdir}" # Hypothetical, but install_skill doesn't support flags in source string
-                     # Actually, let's just use the tree format, it's safer for the parser
-                     install_source = f"{repo_url}/tree/main/{subdir}"
+    install_source = build_install_source(repo_url, subdir)
     
     print(MSG_UPDATING_FROM.format(name=name, source=install_source))
     
@@ -248,7 +218,7 @@ def update_skill(name, force=False):
     
     # Install the updated skill
     # Pass force parameter to avoid interactive prompts
-    success = install_skill(install_source, SKILLS_DIR, run_audit=True, force=force)
+    success = install_skill(install_source, SKILLS_DIR, run_audit=True, force=force, checkout=checkout)
     
     if success:
         print(MSG_UPDATE_SUCCESS.format(name=name))
@@ -268,32 +238,91 @@ def update_skill(name, force=False):
             except Exception as e:
                 print(MSG_RESTORE_FAILED.format(path=backup_path))
 
+def group_by_repository(skills):
+    """
+    Group skills so that subdirectory skills of one repository share a clone.
+    
+    Args:
+        skills: Registry mapping of skill name to info
+    
+    Returns:
+        list of (repo_url, names): repo_url is None for skills updated on their own
+    """
+    shared = {}
+    groups = []
+    for name, info in skills.items():
+        repo_url = info.get('source')
+        subdir = info.get('subdir', '')
+        if repo_url and repo_url != 'local' and subdir:
+            shared.setdefault(parse_source(build_install_source(repo_url, subdir))[0], []).append(name)
+        else:
+            groups.append((None, [name]))
+    for repo_url, names in shared.items():
+        groups.append((repo_url if len(names) > 1 else None, names))
+    return groups
+
+def update_group(repo_url, names):
+    """
+    Update skills that come from the same repository, cloning it only once.
+    
+    Args:
+        repo_url: Repository shared by the skills, or None to update them one by one
+        names: Names of the skills to update
+    """
+    if repo_url is None:
+        for name in names:
+            update_skill(name, force=False)
+        return
+    
+    temp_dir = tempfile.mkdtemp()
+    try:
+        # Full (shallow) checkout: every skill of the group is copied out of it.
+        # If it fails, each update falls back to its own clone.
+        checkout = temp_dir if clone_repository(repo_url, Path(temp_dir)) else None
+        for name in names:
+            update_skill(name, force=False, checkout=checkout)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
 def main():
     parser = argparse.ArgumentParser(description="Manage Trae skills")
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
     subparsers.add_parser('list', help='List installed skills')
-    subparsers.add_parser('check', help='Check for updates')
+    check_parser = subparsers.add_parser('check', help='Check for updates')
+    check_parser.add_argument('--no-cache', action='store_true',
+                              help=f'Query every remote even if it was checked in the last {REMOTE_CACHE_TTL} seconds')
     
     update_parser = subparsers.add_parser('update', help='Update a skill')
     update_parser.add_argument('name', help='Name of the skill to update')
     update_parser.add_argument('--force', '-f', action='store_true', help='Force update without confirmation')
     
-    subparsers.add_parser('update-all', help='Update all skills')
+    update_all_parser = subparsers.add_parser('update-all', help='Update all skills')
+    update_all_parser.add_argument('--jobs', '-j', type=int, default=1,
+                                   help='Number of skills to update in parallel (default: 1; with more, '
+                                        'install and audit output of different skills interleaves)')
 
     args = parser.parse_args()
 
     if args.command == 'list':
         list_skills()
     elif args.command == 'check':
-        check_updates()
+        check_updates(use_cache=not args.no_cache)
     elif args.command == 'update':
         force = getattr(args, 'force', False)
         update_skill(args.name, force=force)
     elif args.command == 'update-all':
-        skills = load_registry()
-        for name in skills:
-            update_skill(name, force=False)
+        # Snapshot the groups: installs update the cached registry as they go
+        groups = group_by_repository(load_registry())
+        jobs = max(1, min(args.jobs, len(groups)))
+        if jobs == 1:
+            for repo_url, names in groups:
+                update_group(repo_url, names)
+        else:
+            # Updates are dominated by git network time; overlap them
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                list(pool.map(lambda group: update_group(*group), groups))
     else:
         parser.print_help()
 
@@ -78,6 +78,7 @@ MSG_SYNCED_SUCCESS = f"{COLOR_GREEN}{ICON_SUCCESS} Synced {{count}} skills to re
 MSG_REGISTRY_FILE = f"   Registry file: {{path}}"
 MSG_SKILLS_LIST = f"\n{ICON_LIST} Skills List:"
 MSG_DRY_RUN = f"{ICON_SEARCH} Dry run: Would sync {{count}} skills"
+MSG_REGISTRY_UP_TO_DATE = f"{COLOR_GREEN}{ICON_SUCCESS} Registry already up to date ({{count}} skills), nothing written{COLOR_RESET}"
 
 # Backup Messages
 MSG_BACKING_UP = f"{COLOR_CYAN}Backing up {{name}}...{COLOR_RESET}"
@@ -85,6 +86,11 @@ MSG_BACKING_UP_ALL = f"{COLOR_CYAN}Backing up all skills...{COLOR_RESET}"
 MSG_BACKUP_SUCCESS = f"{COLOR_GREEN}{ICON_SUCCESS} Backed up {{name}} to {{path}}{COLOR_RESET}"
 MSG_BACKUP_ALL_SUCCESS = f"{COLOR_GREEN}{ICON_SUCCESS} Backed up all skills to {{path}}{COLOR_RESET}"
 MSG_BACKUP_SIZE = f"Backup size: {{size:.2f}} MB"
+MSG_BACKUP_FILE_COUNT = f"Files archived: {{count}}"
+MSG_SKILL_NOT_IN_BACKUP = f"{COLOR_RED}{ICON_ERROR} Skill '{{name}}' not found in backup.{COLOR_RESET}"
+MSG_BACKUP_UNCHANGED = f"{COLOR_GREEN}{ICON_SUCCESS} No changes since last backup, keeping {{path}}{COLOR_RESET}"
+MSG_UNSAFE_BACKUP_PATH = f"{COLOR_YELLOW}{ICON_WARN} Skipping unsafe path in backup: {{path}}{COLOR_RESET}"
+MSG_ZSTD_UNAVAILABLE = f"{COLOR_RED}{ICON_ERROR} zstd backups require the 'zstandard' package (pip install zstandard).{COLOR_RESET}"
 MSG_NO_BACKUPS = "No backups found."
 MSG_AVAILABLE_BACKUPS = f"\n{COLOR_BLUE}Available Backups:{COLOR_RESET}"
 MSG_RESTORING = f"{COLOR_CYAN}Restoring from {{name}}...{COLOR_RESET}"
@@ -7,6 +7,7 @@ Skills Sync - 自动扫描并同步 skills.json
 import sys
 import os
 import json
+import contextlib
 import datetime
 from pathlib import Path
 
@@ -26,67 +27,160 @@ except ImportError:
         MSG_REGISTRY_FILE = f"   Registry file: {{path}}"
         MSG_SKILLS_LIST = f"\nSkills List:"
         MSG_DRY_RUN = f"Dry run: Would sync {{count}} skills"
+        MSG_REGISTRY_UP_TO_DATE = f"{GREEN}Registry already up to date ({{count}} skills), nothing written{RESET}"
 
 SKILLS_DIR = Path(__file__).parent.parent.parent
 REGISTRY_FILE = SKILLS_DIR / 'skills.json'
 
-def scan_skills():
+def _read_git_head(skill_dir):
+    """直接读取 .git/HEAD（及 packed-refs）解析当前提交，避免为每个 skill 启动 git 进程"""
+    git_dir = skill_dir / '.git'
+    try:
+        head = (git_dir / 'HEAD').read_text(encoding='utf-8', errors='replace').strip()
+    except OSError:
+        return ""
+    
+    if not head.startswith('ref: '):
+        return head
+    
+    ref = head[5:].strip()
+    try:
+        return (git_dir / ref).read_text(encoding='utf-8', errors='replace').strip()
+    except OSError:
+        pass
+    
+    # Loose ref missing: look it up in packed-refs ("<sha> <ref>" per line)
+    try:
+        with open(git_dir / 'packed-refs', 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                sha, _, name = line.rstrip('\n').partition(' ')
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return ""
+
+def _git_rev_parse_head(skill_dir):
+    """运行 git rev-parse HEAD（用于 .git 为文件的 worktree/submodule、reftable 等无法直接读取的仓库）"""
+    import subprocess
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=skill_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors='replace')
+    except OSError:
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+def get_git_version(skill_dir):
+    """获取 skill 目录当前的提交（不是 git 仓库时返回空字符串）"""
+    version = _read_git_head(skill_dir)
+    if not version and (skill_dir / '.git').exists():
+        version = _git_rev_parse_head(skill_dir)
+    return version
+
+def load_existing_skills():
+    """读取现有 skills.json 中的 skills（不存在或无法解析时返回空字典）"""
+    try:
+        if REGISTRY_FILE.exists():
+            existing = json.loads(REGISTRY_FILE.read_text(encoding='utf-8'))
+            existing_skills = existing.get('skills', {})
+            if isinstance(existing_skills, dict):
+                return existing_skills
+    except Exception:
+        pass
+    return {}
+
+def registry_unchanged(skills, existing_skills):
+    """扫描结果与现有 skills.json 是否一致（忽略 updated_at）"""
+    if skills.keys() != existing_skills.keys():
+        return False
+    for name, info in skills.items():
+        old = existing_skills[name]
+        if not isinstance(old, dict):
+            return False
+        if any(old.get(key) != info[key] for key in ('source', 'subdir', 'version')):
+            return False
+    return True
+
+def scan_skills(existing_skills=None):
     """扫描所有已安装的 skills"""
     skills = {}
     
-    for skill_dir in SKILLS_DIR.iterdir():
-        if not skill_dir.is_dir() or skill_dir.name.startswith('.'):
-            continue
+    # 现有的 skills.json 只读取解析一次，而不是每个 skill 读一次
+    if existing_skills is None:
+        existing_skills = load_existing_skills()
+    
+    # 本次同步的所有条目共用同一个时间戳
+    now_iso = datetime.datetime.now().isoformat()
+    
+    with os.scandir(SKILLS_DIR) as it:
+        entries = [entry for entry in it
+                   if not entry.name.startswith('.') and entry.is_dir()]
+    
+    for entry in entries:
+        skill_dir = Path(entry.path)
         
         # Check for git repo to get version
         version = "unknown"
         source = "local"
         subdir = ""
-        skill_name = skill_dir.name
+        skill_name = entry.name
         
         # 尝试从现有的 skills.json 获取信息（用于保留远程 skills 的版本信息）
-        try:
-            if REGISTRY_FILE.exists():
-                content = REGISTRY_FILE.read_text(encoding='utf-8')
-                existing = json.loads(content)
-                if skill_name in existing.get('skills', {}):
-                    existing_info = existing['skills'][skill_name]
-                    source = existing_info.get('source', source)
-                    subdir = existing_info.get('subdir', subdir)
-                    version = existing_info.get('version', version)
-        except Exception:
-            pass
+        existing_info = existing_skills.get(skill_name)
+        if isinstance(existing_info, dict):
+            source = existing_info.get('source', source)
+            subdir = existing_info.get('subdir', subdir)
+            version = existing_info.get('version', version)
             
         # Try to update version from git if possible (and if it's a git repo)
-        try:
-            git_dir = skill_dir / '.git'
-            if git_dir.exists():
-                    # It's a git repo root
-                    import subprocess
-                    # Added errors='replace' for robustness against non-UTF8 output
-                    result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=skill_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors='replace')
-                    if result.returncode == 0:
-                        version = result.stdout.strip()
-        except:
-            pass
+        version = get_git_version(skill_dir) or version
         
         skills[skill_name] = {
             "source": source,
             "subdir": subdir,
             "version": version,
-            "updated_at": datetime.datetime.now().isoformat()
+            "updated_at": now_iso
         }
     
     return skills
 
-def sync_registry():
+def print_skills_table(skills):
+    """打印 skills 列表（先拼接所有行，再一次输出）"""
+    lines = [MSG_SKILLS_LIST,
+             f"{'Name':<30} {'Source':<40} {'Version':<12}",
+             "-" * 85]
+    for name, info in sorted(skills.items()):
+        source = info.get('source', 'unknown')
+        version = info.get('version', 'unknown')[:7] if info.get('version') != 'unknown' else 'unknown'
+        lines.append(f"{name:<30} {source:<40} {version:<12}")
+    print('\n'.join(lines))
+
+def sync_registry(force=False):
     """同步 skills.json"""
-    skills = scan_skills()
+    existing_skills = load_existing_skills()
+    skills = scan_skills(existing_skills)
+    
+    # 没有任何变化时不重写文件（保留原有的 updated_at 和文件 mtime）
+    if not force and registry_unchanged(skills, existing_skills):
+        print(MSG_REGISTRY_UP_TO_DATE.format(count=len(skills)))
+        print_skills_table(skills)
+        return True
     
     # 写入更新后的 skills.json
     try:
-        with open(REGISTRY_FILE, 'w', encoding='utf-8') as f:
-            json.dump({"skills": skills}, f, indent=2, ensure_ascii=False)
+        # 先序列化为一个缓冲区，一次写入临时文件后原子替换，避免中途崩溃留下半个文件
+        # 与 install_skill.write_json_cached 一致：写入后 fsync，失败时删除临时文件
+        payload = json.dumps({"skills": skills}, indent=2, ensure_ascii=False).encode('utf-8')
+        tmp_file = REGISTRY_FILE.with_name(REGISTRY_FILE.name + '.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, REGISTRY_FILE)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_file)
+            raise
         
         print(MSG_SYNCED_SUCCESS.format(count=len(skills)))
         print(MSG_REGISTRY_FILE.format(path=REGISTRY_FILE))
@@ -95,26 +189,13 @@ def sync_registry():
         return False
     
     # 列出所有 skills
-    print(MSG_SKILLS_LIST)
-    print(f"{'Name':<30} {'Source':<40} {'Version':<12}")
-    print("-" * 85)
-    for name, info in sorted(skills.items()):
-        source = info.get('source', 'unknown')
-        version = info.get('version', 'unknown')[:7] if info.get('version') != 'unknown' else 'unknown'
-        print(f"{name:<30} {source:<40} {version:<12}")
+    print_skills_table(skills)
     return True
 
 def list_skills():
     """列出所有已安装的 skills"""
     skills = scan_skills()
-    
-    print(MSG_SKILLS_LIST)
-    print(f"{'Name':<30} {'Source':<40} {'Version':<12}")
-    print("-" * 85)
-    for name, info in sorted(skills.items()):
-        source = info.get('source', 'unknown')
-        version = info.get('version', 'unknown')[:7] if info.get('version') != 'unknown' else 'unknown'
-        print(f"{name:<30} {source:<40} {version:<12}")
+    print_skills_table(skills)
 
 def main():
     """主函数"""
@@ -123,6 +204,7 @@ def main():
     parser = argparse.ArgumentParser(description="Sync skills registry")
     parser.add_argument('command', nargs='?', default='sync', choices=['sync', 'list'], help='Command to run (sync or list)')
     parser.add_argument('--dry-run', action='store_true', help='Show changes without writing')
+    parser.add_argument('--force', action='store_true', help='Rewrite skills.json even if nothing changed')
     
     args = parser.parse_args()
     
@@ -135,7 +217,7 @@ def main():
             for name, info in sorted(skills.items()):
                 print(f"  - {name}: {info.get('source', 'unknown')}")
         else:
-            sync_registry()
+            sync_registry(force=args.force)
 
 if __name__ == "__main__":
     main()
@@ -5,11 +5,20 @@ Update All Skills - 自动更新所有已安装的 Trae skills
 """
 
 import sys
+import os
 import json
+import atexit
+import time
 import datetime
-import subprocess
+import shutil
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from messages import *
 except ImportError:
@@ -43,70 +52,203 @@ except ImportError:
         MSG_SUCCESS_COUNT = f"{GREEN}Successfully updated: {{count}}{RESET}"
         MSG_FAILED_COUNT = f"{RED}Failed to update: {{count}}{RESET}"
 
-SKILLS_DIR = Path(__file__).parent.parent.parent
+SCRIPTS_DIR = Path(__file__).parent
+SCRIPTS_DIR_STR = str(SCRIPTS_DIR)
+
+# Reuse the installer next to this script; imported once rather than per update
+if SCRIPTS_DIR_STR not in sys.path:
+    sys.path.append(SCRIPTS_DIR_STR)
+try:
+    from install_skill import (install_skill, build_install_source, REMOTE_CACHE_TTL, ls_remote_head,
+                               load_remote_cache, fresh_remote_heads, save_remote_heads)
+except ImportError:
+    print(f"{RED}Error: Could not import install_skill.py. Make sure it is in the same directory.{RESET}")
+    sys.exit(1)
+SKILLS_DIR = SCRIPTS_DIR.parent.parent
 REGISTRY_FILE = SKILLS_DIR / 'skills.json'
 LOG_FILE = SKILLS_DIR / 'skills_update.log'
 BACKUPS_DIR = SKILLS_DIR / 'backups'
 
+# GITHUB_URL mirror that update checks query instead of github.com ("" = none),
+# read once per run
+CHECK_MIRROR_BASE = os.environ.get("GITHUB_URL", "").rstrip("/")
+if "github.com" in CHECK_MIRROR_BASE:
+    CHECK_MIRROR_BASE = ""
+# Upper bound on concurrent ls-remote queries
+CHECK_WORKERS = 16
+# Default number of skills updated in parallel (--jobs). install_skill and the
+# auditor it runs print straight to stdout, outside LOG_LOCK, so parallel
+# updates interleave their output; one at a time unless asked otherwise
+DEFAULT_UPDATE_JOBS = 1
+# Keeps console output and log file entries of concurrent updates whole
+LOG_LOCK = threading.Lock()
+# Log file stays open for the whole run; entries collect in this buffer and
+# are flushed when it fills up and at exit
+LOG_BUFFER_SIZE = 1 << 16
+_log_file = None
+
+def get_log_file():
+    """Open the log file on first use and keep it open until the process exits"""
+    global _log_file
+    if _log_file is None:
+        _log_file = open(LOG_FILE, 'a', encoding='utf-8', buffering=LOG_BUFFER_SIZE)
+        atexit.register(_log_file.close)
+    return _log_file
+
+# (unix second, formatted timestamp) of the last log line
+_log_timestamp = (None, "")
+
+def log_timestamp():
+    """Timestamp for log entries; formatted at most once per wall-clock second"""
+    global _log_timestamp
+    now = int(time.time())
+    if _log_timestamp[0] != now:
+        _log_timestamp = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+    return _log_timestamp[1]
+
 def log_message(message, end='\n', flush=False):
     """Log message to both console and log file"""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = log_timestamp()
     # Only prefix with timestamp for log file, keep console output clean
     log_entry = f"[{timestamp}] {message}"
-    print(message, end=end, flush=flush)
-    
-    try:
-        with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(log_entry + '\n')
-    except Exception as e:
-        print(f"{RED}Warning: Could not write to log file: {e}{RESET}")
+    with LOG_LOCK:
+        print(message, end=end, flush=flush)
+        
+        try:
+            get_log_file().write(log_entry + '\n')
+        except Exception as e:
+            print(f"{RED}Warning: Could not write to log file: {e}{RESET}")
+
+def log_messages(messages):
+    """Log several lines with a single console write and a single log file write"""
+    timestamp = log_timestamp()
+    log_entries = "".join(f"[{timestamp}] {message}\n" for message in messages)
+    with LOG_LOCK:
+        print("\n".join(messages))
+        
+        try:
+            get_log_file().write(log_entries)
+        except Exception as e:
+            print(f"{RED}Warning: Could not write to log file: {e}{RESET}")
+
+def format_updates(updates):
+    """One "  - name: old -> new" line per available update"""
+    return [f"  - {skill_name}: {info.get('version', 'unknown')[:7]} -> {remote_hash[:7]}"
+            for skill_name, info, remote_hash in updates]
 
 def load_registry():
     if not REGISTRY_FILE.exists():
         return {}
     try:
-        content = REGISTRY_FILE.read_text(encoding='utf-8')
-        return json.loads(content).get('skills', {})
+        content = REGISTRY_FILE.read_bytes()
+        registry = orjson.loads(content) if orjson is not None else json.loads(content)
+        return registry.get('skills', {})
     except Exception as e:
         log_message(f"{RED}Error reading skills.json: {e}{RESET}")
         return {}
 
-def run_command(cmd, cwd=None, capture_output=False):
-    """Run a shell command and check for errors"""
-    try:
-        if capture_output:
-            result = subprocess.run(cmd, check=True, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors='replace')
-            return result.stdout.strip()
-        else:
-            subprocess.run(cmd, check=True, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return True
-    except subprocess.CalledProcessError as e:
-        if not capture_output:
-            stderr = e.stderr.decode('utf-8', errors='replace') if hasattr(e.stderr, 'decode') else e.stderr
-            log_message(f"{RED}Command failed: {stderr}{RESET}")
-        return False
+def get_check_url(repo_url):
+    """Return the URL to query for a skill's remote HEAD (honours GITHUB_URL mirrors)"""
+    if CHECK_MIRROR_BASE and "github.com" in repo_url:
+        return repo_url.replace("https://github.com", CHECK_MIRROR_BASE)
+    return repo_url
+
+def is_checkable(info):
+    """Whether a registry entry has a remote source and a known version to compare"""
+    return (bool(info.get('source')) and info['source'] != 'local'
+            and bool(info.get('version')) and info['version'] != 'unknown')
+
+def fetch_remote_heads(skills, use_cache=True, first_only=False):
+    """
+    Query the remote HEAD of every checkable skill concurrently.
+    
+    Each distinct repository is queried once; the queries are network-bound,
+    so they run on a thread pool and the total wait is about the slowest one.
+    Repositories checked within the last REMOTE_CACHE_TTL seconds are
+    answered from REMOTE_CACHE_FILE without touching the network.
+    
+    Args:
+        skills: Registry mapping of skill name to info
+        use_cache: Whether fresh cache entries may be used (results are
+            written back to the cache either way)
+        first_only: Stop as soon as one repository has moved past the
+            installed version; queries not yet started are cancelled and
+            their URLs are missing from the result. Queries already running
+            still finish (the interpreter waits for them at exit) and their
+            results are saved to the cache as they arrive, so this shortens
+            the report rather than the run when every query has started
+    
+    Returns:
+        dict mapping check URL to remote hash (None if the query failed)
+    """
+    # Installed versions per check URL, to tell when a remote has moved on
+    versions = {}
+    for info in skills.values():
+        if is_checkable(info):
+            versions.setdefault(get_check_url(info['source']), set()).add(info['version'])
+    if not versions:
+        return {}
+    
+    def has_update(url, remote_hash):
+        return remote_hash is not None and any(version != remote_hash for version in versions[url])
+    
+    now = time.time()
+    cache = load_remote_cache()
+    heads = fresh_remote_heads(cache, versions, now) if use_cache else {}
+    if first_only and any(has_update(url, remote_hash) for url, remote_hash in heads.items()):
+        return heads
+    
+    to_fetch = [url for url in versions if url not in heads]
+    if to_fetch:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        fetched = {}
+        pool = ThreadPoolExecutor(max_workers=min(CHECK_WORKERS, len(to_fetch)))
+        try:
+            futures = {pool.submit(ls_remote_head, url): url for url in to_fetch}
+            for future in as_completed(futures):
+                url = futures[future]
+                fetched[url] = future.result()
+                if first_only and has_update(url, fetched[url]):
+                    break
+        finally:
+            # Queries already running finish in the background; queued ones are dropped
+            pool.shutdown(wait=False, cancel_futures=True)
+        heads.update(fetched)
+        save_remote_heads(cache, fetched, now)
+        
+        # --any: cache the answers of queries still running once they arrive
+        save_lock = threading.Lock()
+        
+        def save_late(url, future):
+            if future.cancelled() or future.exception() is not None:
+                return
+            with save_lock:
+                save_remote_heads(cache, {url: future.result()}, now)
+        
+        for future, url in futures.items():
+            if url not in fetched:
+                future.add_done_callback(lambda future, url=url: save_late(url, future))
+    return heads
 
-def check_for_update(skill_name, info):
+def check_for_update(skill_name, info, remote_heads=None):
     """Check if a skill has an update available"""
     repo_url = info.get('source')
     current_version = info.get('version')
     
-    if not repo_url or repo_url == 'local' or not current_version or current_version == 'unknown':
+    if not is_checkable(info):
         return None, "Local skill or missing version info"
     
     log_message(f"Checking {skill_name}...", end='', flush=True)
     
     # Handle GITHUB_URL override for checks
-    check_url = repo_url
-    if "github.com" in repo_url:
-        github_base = os.environ.get("GITHUB_URL", "").rstrip("/")
-        if github_base and "github.com" not in github_base:
-            check_url = repo_url.replace("https://github.com", github_base)
+    check_url = get_check_url(repo_url)
 
-    # Check remote HEAD using git ls-remote
-    remote_head = run_command(['git', 'ls-remote', check_url, 'HEAD'], capture_output=True)
-    if remote_head:
-        remote_hash = remote_head.split()[0]
+    # Check remote HEAD using git ls-remote (unless already fetched in a batch)
+    if remote_heads is not None and check_url in remote_heads:
+        remote_hash = remote_heads[check_url]
+    else:
+        remote_hash = ls_remote_head(check_url)
+    if remote_hash:
         if remote_hash != current_version:
             log_message(f" {GREEN}Update available!{RESET} ({current_version[:7]} -> {remote_hash[:7]})")
             return remote_hash, None
@@ -117,6 +259,32 @@ def check_for_update(skill_name, info):
         log_message(f" {RED}Failed to check remote.{RESET}")
         return None, "Failed to check remote"
 
+def check_all_skills(skills, use_cache=True, first_only=False):
+    """
+    Check every skill for updates.
+    
+    Args:
+        skills: Registry mapping of skill name to info
+        use_cache: Whether recent remote HEAD lookups may be reused
+        first_only: Stop at the first skill with an update (--any)
+    
+    Returns:
+        list of (skill_name, info, remote_hash) for skills with updates
+    """
+    remote_heads = fetch_remote_heads(skills, use_cache=use_cache, first_only=first_only)
+    
+    # Report in registry order once all remotes have answered
+    updates = []
+    for skill_name, info in skills.items():
+        if first_only and is_checkable(info) and get_check_url(info['source']) not in remote_heads:
+            continue  # Query was cancelled once an update had been found
+        remote_hash, error = check_for_update(skill_name, info, remote_heads)
+        if remote_hash:
+            updates.append((skill_name, info, remote_hash))
+            if first_only:
+                break
+    return updates
+
 def backup_skill(skill_name):
     """Backup a skill to backups directory"""
     skill_path = SKILLS_DIR / skill_name
@@ -131,8 +299,18 @@ def backup_skill(skill_name):
     backup_path = BACKUPS_DIR / skill_name / timestamp
     
     try:
-        import shutil
-        shutil.copytree(skill_path, backup_path)
+        copied = False
+        if sys.platform != 'win32':
+            # Hardlink snapshot: no file data is copied. Safe because installs
+            # replace the skill directory as a whole instead of rewriting files.
+            try:
+                shutil.copytree(skill_path, backup_path, copy_function=os.link)
+                copied = True
+            except OSError:
+                # e.g. backups on another filesystem: fall back to a real copy
+                shutil.rmtree(backup_path, ignore_errors=True)
+        if not copied:
+            shutil.copytree(skill_path, backup_path)
         log_message(f"{YELLOW}Backed up {skill_name} to {backup_path}{RESET}")
         return backup_path
     except Exception as e:
@@ -150,25 +328,7 @@ def update_skill(skill_name, info, remote_hash, force=False):
     # Install new version
     log_message(f"{CYAN}Updating {skill_name}...{RESET}")
     
-    # Import install_skill function
-    current_dir = Path(__file__).parent
-    sys.path.append(str(current_dir))
-    try:
-        from install_skill import install_skill
-    except ImportError:
-        log_message(f"{RED}Error: Could not import install_skill.py{RESET}")
-        return False
-    
-    # Construct install source
-    install_source = repo_url
-    if subdir:
-        if "github.com" in repo_url:
-            clean_url = repo_url.rstrip('.git')
-            if '/tree/' not in clean_url:
-                clean_url = clean_url.replace("https://github.com/", "")
-                install_source = f"{clean_url}/{subdir}"
-        else:
-            install_source = f"{repo_url}/{subdir}"
+    install_source = build_install_source(repo_url, subdir)
     
     # Install new version
     success = install_skill(install_source, SKILLS_DIR, run_audit=True, force=force)
@@ -181,7 +341,6 @@ def update_skill(skill_name, info, remote_hash, force=False):
         # Restore backup if available
         if backup_path and backup_path.exists():
             try:
-                import shutil
                 skill_path = SKILLS_DIR / skill_name
                 if skill_path.exists():
                     shutil.rmtree(skill_path)
@@ -198,20 +357,51 @@ def cleanup_old_backups(skill_name, keep=5):
         return
     
     try:
-        backups = sorted(backup_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True)
+        backups = sorted((p for p in backup_dir.iterdir() if not p.name.startswith('.')),
+                         key=lambda p: p.stat().st_mtime, reverse=True)
         old_backups = backups[keep:]
         
+        # Rename every expired backup aside first: each is one metadata-only
+        # rename, so they all leave the listing at once before the slow
+        # per-file deletion. Hidden .trash-* names are never counted as backups.
         for old_backup in old_backups:
             try:
-                import shutil
-                shutil.rmtree(old_backup)
+                old_backup.rename(old_backup.with_name(f".trash-{old_backup.name}"))
                 log_message(f"{YELLOW}Removed old backup: {old_backup}{RESET}")
             except Exception as e:
                 log_message(f"{RED}Error removing old backup {old_backup}: {e}{RESET}")
+        
+        # Also picks up trash left behind by an interrupted cleanup
+        for trash in backup_dir.glob('.trash-*'):
+            shutil.rmtree(trash, ignore_errors=True)
     except Exception as e:
         log_message(f"{RED}Error cleaning up backups: {e}{RESET}")
 
-def update_all_skills(force=False):
+def update_and_clean(skill_name, info, remote_hash, force=False, cleanup_pool=None):
+    """
+    Update one skill and prune its old backups on success.
+    
+    Args:
+        skill_name: Name of the skill
+        info: Registry entry of the skill
+        remote_hash: Remote commit the skill is updated to
+        force: Overwrite without prompting
+        cleanup_pool: Executor to prune backups on, so the next update can
+            start meanwhile; pruned inline if None
+    
+    Returns:
+        bool: True if the skill was updated
+    """
+    if not update_skill(skill_name, info, remote_hash, force=force):
+        return False
+    # Clean up old backups
+    if cleanup_pool is not None:
+        cleanup_pool.submit(cleanup_old_backups, skill_name, 5)
+    else:
+        cleanup_old_backups(skill_name, keep=5)
+    return True
+
+def update_all_skills(force=False, jobs=DEFAULT_UPDATE_JOBS, use_cache=True, first_only=False):
     """Update all skills that have updates available"""
     log_message(f"{BLUE}{'='*60}{RESET}")
     log_message(MSG_START_UPDATE)
@@ -226,19 +416,14 @@ def update_all_skills(force=False):
     log_message(MSG_PHASE_CHECK)
     log_message(f"{'-'*60}")
     
-    updates = []
-    for skill_name, info in skills.items():
-        remote_hash, error = check_for_update(skill_name, info)
-        if remote_hash:
-            updates.append((skill_name, info, remote_hash))
+    # --any only makes sense when the updates are just listed, not applied
+    updates = check_all_skills(skills, use_cache=use_cache, first_only=first_only and not force)
     
     if not updates:
         log_message(MSG_NO_UPDATES)
         return
     
-    log_message(MSG_FOUND_UPDATES.format(count=len(updates)))
-    for skill_name, info, remote_hash in updates:
-        log_message(f"  - {skill_name}: {info.get('version', 'unknown')[:7]} -> {remote_hash[:7]}")
+    log_messages([MSG_FOUND_UPDATES.format(count=len(updates))] + format_updates(updates))
     
     if not force:
         log_message(MSG_FORCE_HINT)
@@ -248,28 +433,37 @@ def update_all_skills(force=False):
     log_message(MSG_PHASE_UPDATE)
     log_message(f"{'-'*60}")
     
-    success_count = 0
-    failed_count = 0
-    
-    for skill_name, info, remote_hash in updates:
-        if update_skill(skill_name, info, remote_hash, force=force):
-            success_count += 1
-            # Clean up old backups
-            cleanup_old_backups(skill_name, keep=5)
+    from concurrent.futures import ThreadPoolExecutor
+    jobs = max(1, min(jobs, len(updates)))
+    # Pruning old backups only touches backups/, so it overlaps the next installs
+    with ThreadPoolExecutor(max_workers=2) as cleanup_pool:
+        if jobs == 1:
+            results = [update_and_clean(skill_name, info, remote_hash, force=force, cleanup_pool=cleanup_pool)
+                       for skill_name, info, remote_hash in updates]
         else:
-            failed_count += 1
+            # Installs are dominated by git network time; overlap them
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(
+                    lambda update: update_and_clean(*update, force=force, cleanup_pool=cleanup_pool),
+                    updates))
+    
+    success_count = sum(results)
+    failed_count = len(results) - success_count
     
     # Summary
-    log_message(f"\n{BLUE}{'='*60}{RESET}")
-    log_message(MSG_UPDATE_SUMMARY)
-    log_message(f"{BLUE}{'='*60}{RESET}")
-    log_message(MSG_TOTAL_CHECKED.format(count=len(skills)))
-    log_message(MSG_UPDATES_AVAILABLE_COUNT.format(count=len(updates)))
-    log_message(MSG_SUCCESS_COUNT.format(count=success_count))
+    summary = [
+        f"\n{BLUE}{'='*60}{RESET}",
+        MSG_UPDATE_SUMMARY,
+        f"{BLUE}{'='*60}{RESET}",
+        MSG_TOTAL_CHECKED.format(count=len(skills)),
+        MSG_UPDATES_AVAILABLE_COUNT.format(count=len(updates)),
+        MSG_SUCCESS_COUNT.format(count=success_count),
+    ]
     if failed_count > 0:
-        log_message(MSG_FAILED_COUNT.format(count=failed_count))
-    log_message(f"Log file: {LOG_FILE}")
-    log_message(f"Backups directory: {BACKUPS_DIR}")
+        summary.append(MSG_FAILED_COUNT.format(count=failed_count))
+    summary.append(f"Log file: {LOG_FILE}")
+    summary.append(f"Backups directory: {BACKUPS_DIR}")
+    log_messages(summary)
 
 def main():
     import argparse
@@ -277,6 +471,13 @@ def main():
     parser = argparse.ArgumentParser(description="Update all Trae skills")
     parser.add_argument('--force', '-f', action='store_true', help='Force update without confirmation')
     parser.add_argument('--check-only', '-c', action='store_true', help='Only check for updates, do not update')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Query every remote even if it was checked in the last {REMOTE_CACHE_TTL} seconds')
+    parser.add_argument('--any', action='store_true',
+                        help='Stop checking at the first skill with an update (ignored with --force)')
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_UPDATE_JOBS,
+                        help=f'Number of skills to update in parallel (default: {DEFAULT_UPDATE_JOBS}; with more, '
+                             'install and audit output of different skills interleaves)')
     
     args = parser.parse_args()
     
@@ -291,22 +492,16 @@ def main():
             log_message("No skills found in registry.")
             return
         
-        updates = []
-        for skill_name, info in skills.items():
-            remote_hash, error = check_for_update(skill_name, info)
-            if remote_hash:
-                updates.append((skill_name, info, remote_hash))
+        updates = check_all_skills(skills, use_cache=not args.no_cache, first_only=args.any)
         
         if not updates:
             log_message(MSG_NO_UPDATES)
         else:
-            log_message(MSG_FOUND_UPDATES.format(count=len(updates)))
-            for skill_name, info, remote_hash in updates:
-                log_message(f"  - {skill_name}: {info.get('version', 'unknown')[:7]} -> {remote_hash[:7]}")
-            log_message(MSG_FORCE_HINT)
+            log_messages([MSG_FOUND_UPDATES.format(count=len(updates))] + format_updates(updates)
+                         + [MSG_FORCE_HINT])
     else:
         # Update all skills
-        update_all_skills(force=args.force)
+        update_all_skills(force=args.force, jobs=args.jobs, use_cache=not args.no_cache, first_only=args.any)
 
 if __name__ == "__main__":
     main()
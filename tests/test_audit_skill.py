@@ -0,0 +1,39 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'skill-auditor' / 'scripts'))
+
+import audit_skill
+
+
+class CheckEncodingSafetyTest(unittest.TestCase):
+    def audit_source(self, source):
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_path = Path(tmp)
+            (skill_path / 'tool.py').write_text(source, encoding='utf-8')
+            return audit_skill.check_encoding_safety(skill_path)
+
+    def test_flags_path_read_and_write_text_without_encoding(self):
+        ok, issues = self.audit_source("s = p.read_text()\np.write_text(s)\n")
+        self.assertFalse(ok)
+        self.assertEqual(len(issues), 2)
+        self.assertEqual([(issue.path, issue.line) for issue in issues], [('tool.py', 1), ('tool.py', 2)])
+
+    def test_accepts_explicit_encoding_and_binary_mode(self):
+        ok, _ = self.audit_source(
+            "s = p.read_text(encoding='utf-8')\n"
+            "p.write_text(s, encoding='utf-8')\n"
+            "f = open(name, 'rb')\n"
+        )
+        self.assertTrue(ok)
+
+    def test_flags_open_without_encoding(self):
+        ok, issues = self.audit_source("f = open(name)\nos.open(name, flags)\n")
+        self.assertFalse(ok)
+        self.assertEqual(len(issues), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
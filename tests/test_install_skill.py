@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'skill-installer' / 'scripts'))
+
+import install_skill
+
+
+def git(*args, cwd):
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                   cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+@unittest.skipUnless(hasattr(os, 'symlink') and os.name == 'posix', "needs POSIX symlinks")
+class InstallSymlinkTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = Path(self.tmp.name)
+        self.dest = root / 'installed'
+        self.dest.mkdir()
+        # Sources like "acme/widget/..." resolve to <GITHUB_BASE>/acme/widget.git
+        self.repo = root / 'base' / 'acme' / 'widget.git'
+        self.repo.mkdir(parents=True)
+        self.base = f"file://{root / 'base'}"
+
+    def commit_repo(self):
+        git('init', '-q', cwd=self.repo)
+        git('add', '-A', cwd=self.repo)
+        git('commit', '-q', '-m', 'init', cwd=self.repo)
+
+    def install(self, source):
+        old_base = install_skill.GITHUB_BASE
+        install_skill.GITHUB_BASE = self.base
+        install_skill.parse_source.cache_clear()
+        try:
+            with redirect_stdout(StringIO()):
+                return install_skill.install_skill(source, self.dest, run_audit=False, force=True)
+        finally:
+            install_skill.GITHUB_BASE = old_base
+            install_skill.parse_source.cache_clear()
+
+    def test_subdir_install_copies_content_behind_link_out_of_subdir(self):
+        (self.repo / 'LICENSE').write_text("MIT\n", encoding='utf-8')
+        skill = self.repo / 'skills' / 'foo'
+        skill.mkdir(parents=True)
+        (skill / 'SKILL.md').write_text("---\nname: foo\ndescription: test\n---\n", encoding='utf-8')
+        os.symlink('../../LICENSE', skill / 'LICENSE')
+        self.commit_repo()
+
+        self.assertTrue(self.install('acme/widget/skills/foo'))
+        installed = self.dest / 'foo' / 'LICENSE'
+        self.assertFalse(installed.is_symlink())
+        self.assertEqual(installed.read_text(encoding='utf-8'), "MIT\n")
+
+    def test_whole_repo_install_copies_content_behind_absolute_link(self):
+        outside = Path(self.tmp.name) / 'outside.txt'
+        outside.write_text("shared\n", encoding='utf-8')
+        (self.repo / 'SKILL.md').write_text("---\nname: widget\ndescription: test\n---\n", encoding='utf-8')
+        os.symlink(outside, self.repo / 'shared.txt')
+        self.commit_repo()
+
+        self.assertTrue(self.install('acme/widget'))
+        installed = self.dest / 'widget' / 'shared.txt'
+        self.assertFalse(installed.is_symlink())
+        self.assertEqual(installed.read_text(encoding='utf-8'), "shared\n")
+
+
+if __name__ == '__main__':
+    unittest.main()